@@ -2,16 +2,19 @@
 
 import _thread
 import contextlib
+import functools
 import os
 import queue
 import select
 import sys
 import threading
 import time
+from array import array
 from collections.abc import Callable
 from pathlib import Path
 from typing import BinaryIO
 
+import numpy as np
 from z180 import IrqLine, Machine, Reg, WatchKind
 from z180.compat import Z180 as CompatZ180
 
@@ -82,6 +85,12 @@ CHORD_STDIN_DEVICES = ("keyboard", "6-key", "6-key-dvorak")
 # successive cells are far further apart even at speed.
 SIX_KEY_CHORD_TIMEOUT = 0.04
 
+# z-core interrupt lines, indexed by QNS INT number.
+_IRQ_LINES = (IrqLine.Int0, IrqLine.Int1, IrqLine.Int2)
+
+# A write-trace hook: (physical address, value, instruction PC, cycle).
+WriteTracer = Callable[[int, int, int, int], None]
+
 
 def _read_stdin_character() -> str:
     """Read one redirected byte or one unbuffered console key."""
@@ -330,6 +339,8 @@ class BNS:
             raise ValueError(f"Unsupported z-core path: {core}")
         if reset not in (None, "warm", "cold"):
             raise ValueError(f"Unsupported reset mode: {reset}")
+        if trace_first_writes is not None and trace_first_writes < 0:
+            raise ValueError("trace_first_writes cannot be negative")
 
         self.clock = clock
         self.model = model
@@ -391,9 +402,19 @@ class BNS:
         self.io.logging = trace_io  # Enable/disable I/O logging
 
         # Write tracking for first-N and dump-all modes
-        self.write_log = []  # List of (addr, value) tuples
-        self.write_counts = {}  # Address -> occurrence count
+        # First-N writes append to compact address/value buffers, which grow
+        # only as far as the firmware actually writes
+        self._write_log_addrs = array("I")
+        self._write_log_values = bytearray()
+        # Physical address -> occurrence count, allocated only when dumping;
+        # 64-bit so a hot address on a long run cannot wrap
+        self.write_counts = (
+            np.zeros(1 << 20, dtype=np.uint64) if dump_writes_file is not None else None
+        )
         self.traced_writes: list[tuple[int, int, int, int]] = []
+        # [TRACE] lines wait here until the next drain prints them in one write
+        self._trace_output: list[tuple[int, int]] = []
+        self._trace_write = self._make_write_tracer()
         self._command_loop_write_count = 0
         # Set when F5 asks for a restart, and read by the CLI once the run
         # loop has unwound and released the terminal.
@@ -409,7 +430,9 @@ class BNS:
         self._keyboard_consume_epoch = 0
         self._reset_complete_writes = 0
 
-        # Statistics
+        # Statistics.  Writes are counted in a plain attribute on the hot
+        # path and published to the stats dict once per drain.
+        self._writes = 0
         self.stats = {
             "cycles": 0,
             "writes": 0,
@@ -481,9 +504,12 @@ class BNS:
                     "regions": regions,
                     "event_capacity": 4096,
                 },
-                mem_read=self._mem_read,
-                mem_write=self._mem_write,
-                io_read=self._native_io_read,
+                # z-core owns internal RAM and reports its writes as events,
+                # so the flash aperture needs no observer frame of its own.
+                mem_read=self.memory.read,
+                mem_write=self.memory.write,
+                # Untraced native reads have no QNS-side effect; skip the wrapper.
+                io_read=self.io.read if not trace_interrupts else self._native_io_read,
                 io_write=self._native_io_write,
             )
             self.memory.ram = self.cpu.ram(0x00000)
@@ -498,7 +524,12 @@ class BNS:
                 clock=clock,
                 mem_read=self._mem_read,
                 mem_write=self._mem_write,
-                io_read=self._io_read,
+                # Likewise unless BL4 must service its watchdog on the read.
+                io_read=(
+                    self.io.read
+                    if not trace_interrupts and profile.family != "bl4"
+                    else self._io_read
+                ),
                 io_write=self._io_write,
                 serial_rx=self._serial_receive,
                 serial_tx=self._serial_transmit,
@@ -521,12 +552,21 @@ class BNS:
             line: IRQ line number (0, 1, or 2)
             source: Name of the interrupt source (for logging)
         """
+        if not self.trace_interrupts:
+            # Untraced edges go straight to their destination.
+            if self.core != "direct":
+                return functools.partial(self.cpu.set_irq, line)
+            pending_irq_states = self._pending_irq_states
+
+            def latch(state: int) -> None:
+                pending_irq_states[line] = bool(state)
+
+            return latch
 
         def callback(state: int) -> None:
-            if self.trace_interrupts:
-                state_str = "ASSERT" if state else "CLEAR"
-                cycles = self._executed_cycles()
-                print(f"[IRQ] INT{line} {state_str} from {source} (cycle ~{cycles})")
+            state_str = "ASSERT" if state else "CLEAR"
+            cycles = self._executed_cycles()
+            print(f"[IRQ] INT{line} {state_str} from {source} (cycle ~{cycles})")
             if self.core == "direct":
                 self._pending_irq_states[line] = bool(state)
             else:
@@ -535,49 +575,33 @@ class BNS:
         return callback
 
     def _mem_read(self, addr: int) -> int:
-        """Read memory and preserve compatibility-path read observers."""
-        if self.core == "compat":
-            input_boundary = self._input_boundary
-            if input_boundary is not None and addr == input_boundary.keyboard_wait_pc:
-                if self.memory.read(input_boundary.keyboard_queue_count) == 0:
-                    self._keyboard_ready_epoch += 1
-                else:
-                    self._keyboard_consume_epoch += 1
+        """Read memory for the compatibility path, preserving its read observers."""
+        input_boundary = self._input_boundary
+        if input_boundary is not None and addr == input_boundary.keyboard_wait_pc:
+            if self.memory.read(input_boundary.keyboard_queue_count) == 0:
+                self._keyboard_ready_epoch += 1
+            else:
+                self._keyboard_consume_epoch += 1
 
-            boundary = self._english_boundary
-            if (
-                self._english_callback is not None
-                and boundary is not None
-                and addr == boundary.capture_addr
-            ):
-                cycle = self.cpu.cycle_count
-                if cycle != self._english_capture_cycle:
-                    self._english_capture_cycle = cycle
-                    source = self.cpu.get_reg(CompatZ180.HL)
-                    segment_length = self.cpu.get_reg(CompatZ180.BC) & 0xFFFF
-                    common_page = self.cpu.cbar >> 4
-                    if (
-                        source == boundary.spbuf
-                        and source >> 12 >= common_page
-                        and 0 < segment_length <= 0xFF
-                    ):
-                        physical = (source + (self.cpu.cbr << 12)) & 0xFFFFF
-                        message = bytearray()
-                        for offset in range(0x100):
-                            value = self.memory.read(physical + offset)
-                            if value == 0:
-                                text = (
-                                    bytes(message)
-                                    .decode(
-                                        "ascii",
-                                        errors="replace",
-                                    )
-                                    .strip()
-                                )
-                                if text:
-                                    self._english_callback(text)
-                                break
-                            message.append(value)
+        boundary = self._english_boundary
+        if (
+            self._english_callback is not None
+            and boundary is not None
+            and addr == boundary.capture_addr
+        ):
+            cycle = self.cpu.cycle_count
+            if cycle != self._english_capture_cycle:
+                self._english_capture_cycle = cycle
+                source = self.cpu.get_reg(CompatZ180.HL)
+                segment_length = self.cpu.get_reg(CompatZ180.BC) & 0xFFFF
+                common_page = self.cpu.cbar >> 4
+                if (
+                    source == boundary.spbuf
+                    and source >> 12 >= common_page
+                    and 0 < segment_length <= 0xFF
+                ):
+                    physical = (source + (self.cpu.cbr << 12)) & 0xFFFFF
+                    self._emit_english_string(physical)
         return self.memory.read(addr)
 
     def _observe_instruction_boundary(self) -> None:
@@ -619,119 +643,195 @@ class BNS:
         ):
             return
         physical = (source + (cbr << 12)) & 0xFFFFF
-        message = bytearray()
-        for offset in range(0x100):
-            value = self.memory.read(physical + offset)
-            if value == 0:
-                text = bytes(message).decode("ascii", errors="replace").strip()
-                if text:
-                    self._english_callback(text)
-                return
-            message.append(value)
+        self._emit_english_string(physical)
+
+    def _emit_english_string(self, physical: int) -> None:
+        """Report the NUL-terminated SPBUF string at one physical address."""
+        message = self.memory.read_block(physical, 0x100)
+        length = message.find(0)
+        if length < 0:
+            return
+        text = message[:length].decode("ascii", errors="replace").strip()
+        if text:
+            self._english_callback(text)
 
     def _mem_write(self, addr: int, value: int) -> None:
-        """Write memory with backend-specific instruction observations."""
-        if self.core == "compat":
-            pc = self.cpu.instruction_pc
-            cycle = self.cpu.cycle_count
-            self._observe_write(
-                addr,
-                value,
-                pc=pc,
-                cycle=cycle,
-            )
+        """Write memory for the compatibility path with instruction observations."""
+        self._observe_write(
+            addr,
+            value,
+            pc=self.cpu.instruction_pc,
+            cycle=self.cpu.cycle_count,
+        )
         self.memory.write(addr, value)
 
     def _observe_write(self, addr: int, value: int, *, pc: int, cycle: int) -> None:
         """Apply QNS write observers after z-core has stored internal RAM."""
-        self.stats["writes"] += 1
+        self._writes += 1
 
         boundary = self._english_boundary
-        if self._english_callback is not None and boundary is not None:
-            common_page = self.memory.cbar >> 4
-            if boundary.spbuf >> 12 >= common_page:
-                physical_spbuf = (boundary.spbuf + (self.memory.cbr << 12)) & 0xFFFFF
-                if addr == physical_spbuf:
-                    self._english_capture_armed = True
+        if boundary is not None and self._english_callback is not None:
+            memory = self.memory
+            spbuf = boundary.spbuf
+            if spbuf >= memory.common1_start and addr == (spbuf + memory.common1_base) & 0xFFFFF:
+                self._english_capture_armed = True
 
         # Count only the linked STARTA instruction that opens another command-loop
         # epoch.  The same timer is also cleared during early RAM initialization.
         input_boundary = self._input_boundary
-        if input_boundary is not None and addr == input_boundary.reset_complete:
-            self._reset_complete_writes += 1
-        if (
-            input_boundary is not None
-            and addr == input_boundary.keyboard_input_buffer
-            and value != 0
-        ):
-            self._keyboard_accept_epoch = self._keyboard_ready_epoch
-        if (
-            input_boundary is not None
-            and addr == input_boundary.keyboard_queue_count
-            and value != 0
-        ):
-            self._keyboard_queue_epoch += 1
-        if (
-            input_boundary is not None
-            and addr == input_boundary.command_loop_timer
-            and value == 0
-            and pc == input_boundary.command_loop_timer_pc
-        ):
-            self._command_loop_write_count += 1
-            if self.memory.read(input_boundary.keyboard_queue_count) == 0:
-                self._keyboard_ready_epoch += 1
+        if input_boundary is not None:
+            if addr == input_boundary.reset_complete:
+                self._reset_complete_writes += 1
+            if value != 0:
+                if addr == input_boundary.keyboard_input_buffer:
+                    self._keyboard_accept_epoch = self._keyboard_ready_epoch
+                if addr == input_boundary.keyboard_queue_count:
+                    self._keyboard_queue_epoch += 1
+            elif (
+                addr == input_boundary.command_loop_timer
+                and pc == input_boundary.command_loop_timer_pc
+            ):
+                self._command_loop_write_count += 1
+                if self.memory.read(input_boundary.keyboard_queue_count) == 0:
+                    self._keyboard_ready_epoch += 1
 
-        single_trace = self.trace_writes_addr is not None and addr == self.trace_writes_addr
-        range_trace = (
-            self.trace_writes_range is not None
-            and self.trace_writes_range[0] <= addr <= self.trace_writes_range[1]
-        )
-        if single_trace or range_trace:
-            self.traced_writes.append((cycle, pc, addr, value))
+        trace_write = self._trace_write
+        if trace_write is not None:
+            trace_write(addr, value, pc, cycle)
 
-        # Single address trace
-        if single_trace:
-            print(f"[TRACE] Write 0x{addr:05X} = 0x{value:02X}")
+    def _make_write_tracer(self) -> WriteTracer | None:
+        """Build a write observer containing only the enabled trace checks.
 
-        # Range trace
-        if range_trace:
-            print(f"[TRACE] Write 0x{addr:05X} = 0x{value:02X}")
+        Each trace kind has its own factory whose hook closes over its fixed
+        settings, so no hook re-tests an option that is switched off.
+        Returns None when no write tracing was requested, so the default
+        observer pays for one local test instead of four disabled ones.
+        """
+        hooks: list[WriteTracer] = []
+        if self.trace_writes_addr is not None or self.trace_writes_range is not None:
+            hooks.append(self._make_address_tracer())
+        if self.trace_first_writes is not None:
+            hooks.append(self._make_first_writes_logger(self.trace_first_writes))
+        if self.write_counts is not None:
+            hooks.append(self._make_write_counter(self.write_counts))
+
+        if not hooks:
+            return None
+        if len(hooks) == 1:
+            return hooks[0]
+
+        def trace(addr: int, value: int, pc: int, cycle: int) -> None:
+            for hook in hooks:
+                hook(addr, value, pc, cycle)
+
+        return trace
+
+    def _make_address_tracer(self) -> WriteTracer:
+        """Retain and print writes to the traced address or address range."""
+        single = self.trace_writes_addr
+        address_range = self.trace_writes_range
+        traced_writes = self.traced_writes
+        trace_output = self._trace_output
+
+        if address_range is None:
+
+            def trace_single(addr: int, value: int, pc: int, cycle: int) -> None:
+                if addr == single:
+                    traced_writes.append((cycle, pc, addr, value))
+                    trace_output.append((addr, value))
+
+            return trace_single
+
+        range_start, range_end = address_range
+
+        if single is None:
+
+            def trace_range(addr: int, value: int, pc: int, cycle: int) -> None:
+                if range_start <= addr <= range_end:
+                    traced_writes.append((cycle, pc, addr, value))
+                    trace_output.append((addr, value))
+
+            return trace_range
+
+        def trace_both(addr: int, value: int, pc: int, cycle: int) -> None:
+            single_trace = addr == single
+            range_trace = range_start <= addr <= range_end
+            if single_trace or range_trace:
+                # One causal event, but a line from each matching selector.
+                traced_writes.append((cycle, pc, addr, value))
+                if single_trace:
+                    trace_output.append((addr, value))
+                if range_trace:
+                    trace_output.append((addr, value))
 
-        # First-N trace
-        if self.trace_first_writes is not None and len(self.write_log) < self.trace_first_writes:
-            self.write_log.append((addr, value))
+        return trace_both
 
-        # All writes dump
-        if self.dump_writes_file is not None:
-            self.write_counts[addr] = self.write_counts.get(addr, 0) + 1
+    def _make_first_writes_logger(self, limit: int) -> WriteTracer:
+        """Append writes to the first-N buffers until the limit is reached."""
+        write_log_addrs = self._write_log_addrs
+        write_log_values = self._write_log_values
+
+        def log_first_writes(addr: int, value: int, pc: int, cycle: int) -> None:
+            if len(write_log_values) < limit:
+                write_log_addrs.append(addr)
+                write_log_values.append(value)
+
+        return log_first_writes
+
+    def _make_write_counter(self, write_counts: np.ndarray) -> WriteTracer:
+        """Count every write per physical address for --dump-writes."""
+
+        def count_write(addr: int, value: int, pc: int, cycle: int) -> None:
+            write_counts[addr] += 1
+
+        return count_write
+
+    def _publish_write_observations(self) -> None:
+        """Publish write statistics and print trace lines buffered since the last drain."""
+        self.stats["writes"] = self._writes
+        trace_output = self._trace_output
+        if trace_output:
+            sys.stdout.write(
+                "".join(
+                    f"[TRACE] Write 0x{addr:05X} = 0x{value:02X}\n" for addr, value in trace_output
+                )
+            )
+            trace_output.clear()
 
     def _process_memory_events(self) -> None:
         """Drain native exact-cycle events before their bounded queue can overflow."""
-        for event in self.cpu.drain_events():
-            if event["kind"] == "mem_write":
-                self._observe_write(
-                    event["phys"],
-                    event["value"],
-                    pc=event["pc"],
-                    cycle=event["cycle"],
-                )
-            elif event["kind"] == "io_write":
-                port = event["port"] & 0xFF
-                if self.ssi263.base_port <= port < self.ssi263.base_port + 5:
-                    self.ssi263.confirm_write_cycle(port, event["value"], event["cycle"])
-                if port == self._timed_power_latch_port():
-                    callback_cycle = self._callback_cycle
-                    self._callback_cycle = event["cycle"]
-                    try:
-                        self.io.write(port, event["value"])
-                    finally:
-                        self._callback_cycle = callback_cycle
-            elif (
-                event["kind"] == "io_read"
-                and self.profile.family == "bl4"
-                and event["port"] & 0xFF == self.keyboard.port
-            ):
-                self.watchdog.service(event["cycle"])
+        events = self.cpu.drain_events()
+        if events:
+            # Write events dominate a drain, so resolve everything a batch
+            # needs once rather than once per event.
+            observe_write = self._observe_write
+            ssi263 = self.ssi263
+            ssi263_start = ssi263.base_port
+            ssi263_end = ssi263_start + 5
+            timed_port = self._timed_power_latch_port()
+            bl4_keyboard_port = self.keyboard.port if self.profile.family == "bl4" else None
+            for event in events:
+                kind = event["kind"]
+                if kind == "mem_write":
+                    observe_write(
+                        event["phys"],
+                        event["value"],
+                        pc=event["pc"],
+                        cycle=event["cycle"],
+                    )
+                elif kind == "io_write":
+                    port = event["port"] & 0xFF
+                    if ssi263_start <= port < ssi263_end:
+                        ssi263.confirm_write_cycle(port, event["value"], event["cycle"])
+                    if port == timed_port:
+                        callback_cycle = self._callback_cycle
+                        self._callback_cycle = event["cycle"]
+                        try:
+                            self.io.write(port, event["value"])
+                        finally:
+                            self._callback_cycle = callback_cycle
+                elif kind == "io_read" and event["port"] & 0xFF == bl4_keyboard_port:
+                    self.watchdog.service(event["cycle"])
         if self.cpu.events_lost():
             raise RuntimeError("z-core memory events were lost; QNS observers are invalid")
 
@@ -746,14 +846,11 @@ class BNS:
     def _read_io(self, port: int, *, service_bl4_watchdog: bool) -> int:
         """Read the I/O bus, optionally applying callback-timed read effects."""
         value = self.io.read(port)
-        if (
-            service_bl4_watchdog
-            and self.profile.family == "bl4"
-            and port & 0xFF == self.keyboard.port
-        ):
+        low_port = port & 0xFF
+        if service_bl4_watchdog and self.profile.family == "bl4" and low_port == self.keyboard.port:
             self.watchdog.service(self._callback_cycle)
         # Trace ITC register reads
-        if self.trace_interrupts and (port & 0xFF) == self.PORT_ITC:
+        if self.trace_interrupts and low_port == self.PORT_ITC:
             self._log_itc("READ", value)
         return value
 
@@ -765,12 +862,13 @@ class BNS:
 
     def _io_write(self, port: int, value: int) -> None:
         """I/O write callback for CPU."""
+        low_port = port & 0xFF
         # Trace ITC register writes
-        if self.trace_interrupts and (port & 0xFF) == self.PORT_ITC:
+        if self.trace_interrupts and low_port == self.PORT_ITC:
             self._log_itc("WRITE", value)
-        low_port = port & 0xFF
-        if self.core == "direct" and self.ssi263.base_port <= low_port < self.ssi263.base_port + 5:
-            self.ssi263.defer_next_write_cycle()
+        ssi263 = self.ssi263
+        if self.core == "direct" and ssi263.base_port <= low_port < ssi263.base_port + 5:
+            ssi263.defer_next_write_cycle()
         self.io.write(port, value)
 
     def _timed_power_latch_port(self) -> int | None:
@@ -860,15 +958,9 @@ class BNS:
             self.io.register(self.PORT_RS232_POWER, write_handler=self._write_rs232_power)
 
         # MMU registers
-        self.io.register(
-            self.PORT_CBR, lambda p: self.memory.cbr, lambda p, v: self.memory.set_mmu(cbr=v)
-        )
-        self.io.register(
-            self.PORT_BBR, lambda p: self.memory.bbr, lambda p, v: self.memory.set_mmu(bbr=v)
-        )
-        self.io.register(
-            self.PORT_CBAR, lambda p: self.memory.cbar, lambda p, v: self.memory.set_mmu(cbar=v)
-        )
+        self.io.register(self.PORT_CBR, self.memory.cbr_read, self.memory.cbr_write)
+        self.io.register(self.PORT_BBR, self.memory.bbr_read, self.memory.bbr_write)
+        self.io.register(self.PORT_CBAR, self.memory.cbar_read, self.memory.cbar_write)
 
     def _write_speech_power(self, port: int, value: int) -> None:
         """Apply the BSPLUS speech-power latch's bit-zero state."""
@@ -1007,12 +1099,13 @@ class BNS:
 
     def _apply_pending_irqs(self) -> None:
         """Apply device IRQ state only outside z-core bus callbacks."""
-        lines = (IrqLine.Int0, IrqLine.Int1, IrqLine.Int2)
-        for number, line in enumerate(lines):
-            state = self._pending_irq_states[number]
-            if self._applied_irq_states[number] != state:
+        pending = self._pending_irq_states
+        applied = self._applied_irq_states
+        for number, line in enumerate(_IRQ_LINES):
+            state = pending[number]
+            if applied[number] != state:
                 self.cpu.set_irq(line, state)
-                self._applied_irq_states[number] = state
+                applied[number] = state
 
     def _pump_serial_inputs(self) -> None:
         """Offer retained ASCI and CSI/O input bytes to z-core."""
@@ -1059,16 +1152,21 @@ class BNS:
         if pump_inputs:
             self._pump_serial_inputs()
         self._observe_instruction_boundary()
-        self._callback_cycle = self.cpu.cycle_count()
-        self.ssi263.set_cycle_count(self._callback_cycle)
-        self._callback_pc = self.cpu.reg(Reg.PC)
-        if self._pc_watch_address == self._callback_pc:
-            self._pc_watch_cycle = self._callback_cycle
-            self._pc_watch_cbar = self.cpu.io_reg_peek(self.PORT_CBAR)
+        cpu = self.cpu
+        cycle = self._callback_cycle = cpu.cycle_count()
+        self.ssi263.set_cycle_count(cycle)
+        pc = self._callback_pc = cpu.reg(Reg.PC)
+        if self._pc_watch_address == pc:
+            self._pc_watch_cycle = cycle
+            self._pc_watch_cbar = cpu.io_reg_peek(self.PORT_CBAR)
 
     def _finish_execution(self) -> None:
         """Drain all native outputs and observer events after execution."""
-        self._process_memory_events()
+        try:
+            self._process_memory_events()
+        finally:
+            # Writes observed before a failed drain still get their lines.
+            self._publish_write_observations()
         self._drain_serial_outputs()
 
     def _execute_instruction(self, *, pump_inputs: bool = True) -> int:
@@ -1163,7 +1261,12 @@ class BNS:
     def _execute_budget(self, cycles: int) -> int:
         """Execute at least the requested cycle budget with correct device ordering."""
         if self.core == "compat":
-            return self.cpu.run(cycles)
+            # Compat observes writes during run, so an interrupted run must
+            # still print its buffered trace lines and update the stats.
+            try:
+                return self.cpu.run(cycles)
+            finally:
+                self._publish_write_observations()
 
         if self._requires_instruction_steps():
             self._pump_serial_inputs()
@@ -1177,10 +1280,11 @@ class BNS:
 
         self._apply_pending_irqs()
         self._pump_serial_inputs()
-        self._callback_cycle = self.cpu.cycle_count()
-        self.ssi263.set_cycle_count(self._callback_cycle)
-        self._callback_pc = self.cpu.reg(Reg.PC)
-        actual = self.cpu.run(cycles)
+        cpu = self.cpu
+        cycle = self._callback_cycle = cpu.cycle_count()
+        self.ssi263.set_cycle_count(cycle)
+        self._callback_pc = cpu.reg(Reg.PC)
+        actual = cpu.run(cycles)
         self._finish_execution()
         return actual
 
@@ -1452,6 +1556,20 @@ class BNS:
         budget_cycles = 0
         start_cycle = self._executed_cycles()
         start_wall = time.perf_counter()
+        # These are fixed for the session, so test them once rather than
+        # once per chunk.
+        realtime = self.realtime
+        io_logging = self.io.logging
+        stdio_output = self.stdio_output
+        # Bind the per-chunk calls once; the loop runs thousands of times
+        # per emulated second.
+        stop_requested = self._stdio_stop_requested.is_set
+        next_watch_pc = self._stdio_watch_queue.get_nowait
+        execute_budget = self._execute_budget
+        executed_cycles_now = self._executed_cycles
+        ssi263 = self.ssi263
+        stats = self.stats
+        chunk_size = self._chunk_cycles
         try:
             # Under the cleanup handler, not before it: a control key
             # pressed while this is still connecting has to unwind
@@ -1460,11 +1578,11 @@ class BNS:
             self._arm_controls()
             start_wall = time.perf_counter()
             while max_cycles == 0 or budget_cycles < max_cycles:
-                if self._stdio_stop_requested.is_set():
+                if stop_requested():
                     break
 
                 try:
-                    watch_pc = self._stdio_watch_queue.get_nowait()
+                    watch_pc = next_watch_pc()
                 except queue.Empty:
                     pass
                 else:
@@ -1478,20 +1596,19 @@ class BNS:
                             pc=watch_pc,
                         )
 
-                chunk_size = self._chunk_cycles
                 chunk = (
                     chunk_size if max_cycles == 0 else min(chunk_size, max_cycles - budget_cycles)
                 )
-                actual = self._execute_budget(chunk)
+                actual = execute_budget(chunk)
                 budget_cycles += actual
-                executed_cycles = self._executed_cycles()
-                self.stats["cycles"] = executed_cycles
+                executed_cycles = executed_cycles_now()
+                stats["cycles"] = executed_cycles
                 if self._power_off_requested:
                     self.exit_reason = "device powered off"
                     print(f"Emulation stopped: {self.exit_reason}")
                     break
 
-                if self.realtime:
+                if realtime:
                     # Hold emulated time to wall-clock time.  The chip already
                     # paces phonemes correctly in emulated time, so once the
                     # two clocks agree, a phoneme that lasts 120 ms of emulated
@@ -1503,19 +1620,21 @@ class BNS:
                     if sleep_duration > 0:
                         time.sleep(sleep_duration)
 
-                watch_hits = (
-                    self.cpu.pc_watch_hits() if self.core == "direct" else self.cpu.pc_watch_count
-                )
                 if (
-                    self.stdio_output is not None
+                    stdio_output is not None
                     and self._stdio_watch_pc is not None
-                    and watch_hits > 0
                     and not pc_watch_reported
+                    and (
+                        self.cpu.pc_watch_hits()
+                        if self.core == "direct"
+                        else self.cpu.pc_watch_count
+                    )
+                    > 0
                 ):
                     if self.core == "compat":
                         self._pc_watch_cycle = self.cpu.pc_watch_cycle
                         self._pc_watch_cbar = self.cpu.pc_watch_cbar
-                    self.stdio_output.emit(
+                    stdio_output.emit(
                         "cpu",
                         event="pc-watch",
                         pc=self._stdio_watch_pc,
@@ -1524,24 +1643,22 @@ class BNS:
                     )
                     pc_watch_reported = True
 
-                # Update SSI-263 cycle count and check for pending phoneme completion IRQ
-                self.ssi263.set_cycle_count(executed_cycles)
-                self.ssi263.check_pending_irq(executed_cycles)
+                # Publish the SSI-263 cycle count and complete any pending phoneme
+                ssi263.check_pending_irq(executed_cycles)
 
                 if input_driver is not None:
                     input_driver.tick()
 
-                self.stats["phonemes"] = len(self.ssi263.phoneme_log)
-
                 # Print I/O log if tracing (periodically to avoid flooding)
-                if self.io.logging and self.io._log:
+                if io_logging:
                     for entry in self.io.dump_log():
                         print(f"[IO] {entry}")
-                    self.io._log.clear()
+                    self.io.clear_log()
 
         except KeyboardInterrupt:
             print("\nEmulation stopped by user")
         finally:
+            self.stats["phonemes"] = len(self.ssi263.phoneme_log)
             self._disarm_controls()
             terminal.close()
             if self.synth:
@@ -1558,12 +1675,15 @@ class BNS:
         """Execute a single instruction. Returns cycles consumed."""
         if self.core == "direct":
             return self._execute_instruction()
-        return self.cpu.step()
+        try:
+            return self.cpu.step()
+        finally:
+            self._publish_write_observations()
 
     def dump_ram(self, path: Path | str) -> None:
         """Dump RAM contents to a file."""
         path = Path(path)
-        path.write_bytes(bytes(self.memory.ram))
+        path.write_bytes(self.memory.ram)
         print(f"RAM dumped to {path} ({len(self.memory.ram)} bytes)")
 
     def load_state(self, path: Path | str) -> None:
@@ -1602,31 +1722,47 @@ class BNS:
             cbr = self.cpu.cbr
             bbr = self.cpu.bbr
             cbar = self.cpu.cbar
-        print("\n=== Execution Statistics ===")
-        print(f"Cycles executed: {self.stats['cycles']:,}")
-        print(f"Memory writes:   {self.stats['writes']:,}")
-        print(f"Phonemes output: {self.stats['phonemes']}")
-        print(f"Final PC:        0x{pc:04X}")
-        print(f"CPU halted:      {halted}")
-        print(f"MMU state:       CBR=0x{cbr:02X} BBR=0x{bbr:02X} CBAR=0x{cbar:02X}")
+        lines = (
+            "\n=== Execution Statistics ===",
+            f"Cycles executed: {self.stats['cycles']:,}",
+            f"Memory writes:   {self.stats['writes']:,}",
+            f"Phonemes output: {self.stats['phonemes']}",
+            f"Final PC:        0x{pc:04X}",
+            f"CPU halted:      {halted}",
+            f"MMU state:       CBR=0x{cbr:02X} BBR=0x{bbr:02X} CBAR=0x{cbar:02X}",
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @property
+    def write_log(self) -> list[tuple[int, int]]:
+        """Return the first-N traced writes as (address, value) pairs."""
+        return list(zip(self._write_log_addrs, self._write_log_values))
 
     def dump_trace_data(self) -> None:
         """Dump traced data to files."""
         # Dump first-N writes
-        if self.trace_first_writes is not None and self.write_log:
-            print(f"\n=== First {len(self.write_log)} Memory Writes ===")
-            for i, (addr, value) in enumerate(self.write_log, 1):
-                print(f"{i:3d}. 0x{addr:05X} = 0x{value:02X}")
+        if self.trace_first_writes is not None and self._write_log_values:
+            lines = [f"\n=== First {len(self._write_log_values)} Memory Writes ==="]
+            lines.extend(
+                f"{i:3d}. 0x{addr:05X} = 0x{value:02X}"
+                for i, (addr, value) in enumerate(self.write_log, 1)
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Dump all writes to CSV
-        if self.dump_writes_file is not None and self.write_counts:
+        if self.dump_writes_file is not None and self.write_counts.any():
             path = Path(self.dump_writes_file)
-            with path.open("w") as f:
-                f.write("address,count\n")
-                for addr in sorted(self.write_counts.keys()):
-                    count = self.write_counts[addr]
-                    f.write(f"0x{addr:05X},{count}\n")
-            print(f"\nDumped {len(self.write_counts)} unique write addresses to {path.name}")
+            # Keep addresses unsigned too: stacking intp with uint64 counts
+            # would promote both columns to float.
+            addresses = np.flatnonzero(self.write_counts).astype(np.uint64)
+            np.savetxt(
+                path,
+                np.column_stack((addresses, self.write_counts[addresses])),
+                fmt="0x%05X,%d",
+                header="address,count",
+                comments="",
+            )
+            print(f"\nDumped {len(addresses)} unique write addresses to {path.name}")
 
     def trace_boot(self) -> None:
         """Trace the boot sequence (diagnostic mode)."""
@@ -1642,16 +1778,17 @@ class BNS:
         # Show first few bytes after header
         entry = 2 + self.memory.rom[1]  # After JR offset
         print(f"Entry point: 0x{entry:04X}")
-        print(f"First bytes: {' '.join(f'{b:02X}' for b in self.memory.rom[entry : entry + 16])}")
+        print(f"First bytes: {self.memory.rom[entry : entry + 16].hex(' ').upper()}")
 
         # Try stepping through first instructions
         self.reset()
-        print("\n=== First 10 instructions ===")
+        lines = ["\n=== First 10 instructions ==="]
         for i in range(10):
             pc_before = self.cpu.reg(Reg.PC) if self.core == "direct" else self.cpu.pc
             cycles = self.step()
             pc_after = self.cpu.reg(Reg.PC) if self.core == "direct" else self.cpu.pc
-            print(f"{i + 1}. PC: {pc_before:04X} -> {pc_after:04X} ({cycles} cycles)")
+            lines.append(f"{i + 1}. PC: {pc_before:04X} -> {pc_after:04X} ({cycles} cycles)")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
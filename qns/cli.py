@@ -14,6 +14,8 @@ from .ssi263 import Phoneme
 from .stdio import JSONLOutput
 
 _SPEECH_STYLES = ("codes", "names", "ipa", "examples", "english")
+# Display cell byte (as a Latin-1 character) -> Unicode Braille pattern
+_BRAILLE_CELLS = str.maketrans({chr(cell): chr(0x2800 | cell) for cell in range(0x100)})
 DEFAULT_SYNTH_BACKEND = "pcm"
 
 
@@ -410,6 +412,8 @@ def main(argv: list[str] | None = None) -> None:
         )
     if args.watch_pc is not None and not args.stdio:
         parser.error("--watch-pc requires --stdio jsonl")
+    if args.trace_first_writes is not None and args.trace_first_writes < 0:
+        parser.error("--trace-first-writes cannot be negative")
     if args.watch_pc is not None and not 0 <= args.watch_pc <= 0xFFFF:
         parser.error("--watch-pc must be a logical address from 0x0000 through 0xFFFF")
 
@@ -567,9 +571,9 @@ def main(argv: list[str] | None = None) -> None:
                     nonlocal display_frame_emitted
                     display_frame_emitted = True
                     if args.display == "codes":
-                        display = " ".join(f"{cell:02X}" for cell in frame)
+                        display = frame.hex(" ").upper()
                     else:
-                        display = "".join(chr(0x2800 | cell) for cell in frame)
+                        display = frame.decode("latin-1").translate(_BRAILLE_CELLS)
                     print(f"Display {args.display}: {display}", flush=True)
 
                 bns.display.set_frame_callback(emit_display_frame)
@@ -5,15 +5,45 @@ from collections.abc import Callable
 ReadHandler = Callable[[int], int]
 WriteHandler = Callable[[int, int], None]
 
+# Traced accesses kept between drains; older entries are overwritten.
+_LOG_CAPACITY = 4096
+
+
+def _unmapped_read(port: int) -> int:
+    """Float the data bus high for a port with no device."""
+    return 0xFF
+
+
+def _unmapped_write(port: int, value: int) -> None:
+    """Discard a write to a port with no device."""
+
 
 class IOBus:
-    """Central I/O bus coordinator."""
+    """Central I/O bus coordinator.
+
+    Handlers live in 256-entry tables indexed by the low port byte, so a
+    CPU IN/OUT dispatches with one list index and no missing-port branch.
+    """
+
+    __slots__ = (
+        "_read_handlers",
+        "_write_handlers",
+        "_log_ops",
+        "_log_ports",
+        "_log_values",
+        "_log_count",
+        "logging",
+    )
 
     def __init__(self):
-        self._read_handlers: dict[int, ReadHandler] = {}
-        self._write_handlers: dict[int, WriteHandler] = {}
-        self._log: list[tuple[str, int, int]] = []
-        self.logging = True
+        self._read_handlers: list[ReadHandler] = [_unmapped_read] * 0x100
+        self._write_handlers: list[WriteHandler] = [_unmapped_write] * 0x100
+        # Access log ring: one byte each for the operation, port, and value.
+        self._log_ops = bytearray(_LOG_CAPACITY)
+        self._log_ports = bytearray(_LOG_CAPACITY)
+        self._log_values = bytearray(_LOG_CAPACITY)
+        self._log_count = 0
+        self.logging = False
 
     def register(
         self,
@@ -41,10 +71,9 @@ class IOBus:
     def read(self, port: int) -> int:
         """Read from I/O port."""
         port &= 0xFF
-        handler = self._read_handlers.get(port)
-        value = handler(port) if handler else 0xFF
+        value = self._read_handlers[port](port)
         if self.logging:
-            self._log.append(("R", port, value))
+            self._record(0x52, port, value)  # "R"
         return value
 
     def write(self, port: int, value: int) -> None:
@@ -52,12 +81,33 @@ class IOBus:
         port &= 0xFF
         value &= 0xFF
         if self.logging:
-            self._log.append(("W", port, value))
-        handler = self._write_handlers.get(port)
-        if handler:
-            handler(port, value)
+            self._record(0x57, port, value)  # "W"
+        self._write_handlers[port](port, value)
+
+    def _record(self, op: int, port: int, value: int) -> None:
+        """Store one traced access in the log ring."""
+        count = self._log_count
+        slot = count % _LOG_CAPACITY
+        self._log_ops[slot] = op
+        self._log_ports[slot] = port
+        self._log_values[slot] = value & 0xFF
+        self._log_count = count + 1
 
     def dump_log(self, last_n: int | None = None) -> list[str]:
-        """Get formatted I/O log."""
-        log = self._log[-last_n:] if last_n else self._log
-        return [f"{op} port={port:02X} val={val:02X}" for op, port, val in log]
+        """Get formatted I/O log, oldest retained entry first."""
+        count = self._log_count
+        retained = min(count, _LOG_CAPACITY)
+        if last_n:
+            retained = min(retained, last_n)
+        entries = []
+        for index in range(count - retained, count):
+            slot = index % _LOG_CAPACITY
+            entries.append(
+                f"{chr(self._log_ops[slot])} port={self._log_ports[slot]:02X} "
+                f"val={self._log_values[slot]:02X}"
+            )
+        return entries
+
+    def clear_log(self) -> None:
+        """Discard all logged accesses."""
+        self._log_count = 0
@@ -8,6 +8,18 @@ FrameCallback = Callable[[bytes], None]
 class BrailleDisplay:
     """Braille Lite 18 display connected through the Z180 CSI/O port."""
 
+    __slots__ = (
+        "cells",
+        "buffer",
+        "cursor",
+        "status",
+        "battery",
+        "current",
+        "_cell_follows",
+        "_response",
+        "_frame_callback",
+    )
+
     def __init__(
         self,
         cells: int = 18,
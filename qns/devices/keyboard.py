@@ -78,6 +78,16 @@ class BrailleKeyboard:
 class TNSKeyboard:
     """Type 'n Speak keyboard-PIC scan-byte input on INT2."""
 
+    __slots__ = (
+        "port",
+        "code",
+        "latched",
+        "_down_code",
+        "_pending_codes",
+        "_power_on_codes",
+        "_irq_callback",
+    )
+
     def __init__(self, port: int = 0xD0) -> None:
         self.port = port
         self.code = 0
@@ -4,9 +4,10 @@
 class Watchdog:
     """Watchdog timer."""
 
+    __slots__ = ("port", "serviced_at")
+
     def __init__(self, port: int = 0x80):
         self.port = port
-        self.counter = 0
         self.serviced_at: int | None = None
 
     def read(self, port: int) -> int:
@@ -18,5 +19,4 @@ class Watchdog:
 
     def service(self, cycle: int | None = None) -> None:
         """Reset the watchdog and retain the exact service cycle when known."""
-        self.counter = 0
         self.serviced_at = cycle
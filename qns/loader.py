@@ -8,6 +8,8 @@ packages, 0x7000/0x8000 for Millennium), so the boundary is discovered
 from the metadata rather than assumed.
 """
 
+import functools
+import mmap
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -91,34 +93,64 @@ class FirmwareImage:
 
 
 def load_firmware(path: Path | str) -> FirmwareImage:
-    """Extract firmware from a raw image, .bin dump, or update package."""
+    """Extract firmware from a raw image, .bin dump, or update package.
+
+    The file is mapped rather than read, so a package's header and CRC
+    scan touch its pages in place and only the image itself is copied out.
+    Recent extractions are cached by resolved path, size and modification
+    time, so harnesses that reload one ROM repeatedly, however they spell
+    its path, skip the read and CRC scan.
+    """
     path = Path(path)
-    data = path.read_bytes()
-    package_size = len(data)
-
-    if path.suffix.lower() == ".bin" and len(data) in _PRE_EXTRACTED_SIZES:
-        return FirmwareImage(
-            data=data,
-            package_size=package_size,
-            kind="pre-extracted",
-            image_offset=None,
-        )
+    stat = path.stat()
+    return _extract_firmware(
+        path.resolve(),
+        path.suffix.lower() == ".bin",
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
 
-    if len(data) >= 5 and data[2:5] == b"BNS":
-        image_offset = _find_image_offset(data)
-        return FirmwareImage(
-            data=data[image_offset:],
-            package_size=package_size,
-            kind="package",
-            image_offset=image_offset,
-        )
 
-    return FirmwareImage(
-        data=data,
-        package_size=package_size,
-        kind="raw",
-        image_offset=None,
-    )
+@functools.lru_cache(maxsize=4)
+def _extract_firmware(
+    path: Path,
+    bin_name: bool,
+    package_size: int,
+    mtime_ns: int,
+) -> FirmwareImage:
+    """Extract one file revision; the size and mtime only key the cache.
+
+    ``bin_name`` carries the suffix of the name the caller used, since a
+    resolved symlink may not keep it.
+    """
+    with path.open("rb") as file:
+        if package_size == 0:
+            # mmap refuses empty files; an empty image is simply raw.
+            return FirmwareImage(data=b"", package_size=0, kind="raw", image_offset=None)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if bin_name and package_size in _PRE_EXTRACTED_SIZES:
+                return FirmwareImage(
+                    data=data[:],
+                    package_size=package_size,
+                    kind="pre-extracted",
+                    image_offset=None,
+                )
+
+            if package_size >= 5 and data[2:5] == b"BNS":
+                image_offset = _find_image_offset(data)
+                return FirmwareImage(
+                    data=data[image_offset:],
+                    package_size=package_size,
+                    kind="package",
+                    image_offset=image_offset,
+                )
+
+            return FirmwareImage(
+                data=data[:],
+                package_size=package_size,
+                kind="raw",
+                image_offset=None,
+            )
 
 
 @dataclass(frozen=True)
@@ -657,7 +689,7 @@ def _find_signature(data: bytes, signature: tuple[_Insn, ...]) -> list[int]:
     return matches
 
 
-def _find_image_offset(data: bytes) -> int:
+def _find_image_offset(data: bytes | mmap.mmap) -> int:
     """Find the unique 4 KiB-aligned length/CRC-validated image boundary."""
     matches = []
     for image_offset in range(0x1000, len(data), 0x1000):
@@ -2,12 +2,15 @@
 
 from pathlib import Path
 
+import numpy as np
+
 _STATE_MAGIC_V1 = b"QNSRAM\x00\x01"
 _STATE_MAGIC_V2 = b"QNSRAM\x00\x02"
 _STATE_MAGIC_V3 = b"QNSRAM\x00\x03"
 
 _FLASH_WINDOW_START = 0x80000
 _FLASH_PAGE_SIZE = 0x80000
+_FLASH_WINDOW_END = _FLASH_WINDOW_START + _FLASH_PAGE_SIZE
 _FLASH_SECTOR_SIZE = 0x10000
 _FLASH_ENABLE = 0x08
 _FLASH_UNLOCK_1 = 0x5555
@@ -22,6 +25,22 @@ class Memory:
     serve only the optional banked flash aperture.
     """
 
+    __slots__ = (
+        "_ram",
+        "_ram_len",
+        "rom",
+        "flash",
+        "_flash_size",
+        "high_bank_latch",
+        "_flash_window_offset",
+        "_flash_command",
+        "cbr",
+        "bbr",
+        "cbar",
+        "common1_start",
+        "common1_base",
+    )
+
     def __init__(
         self,
         ram_size: int = 512 * 1024,
@@ -29,16 +48,23 @@ class Memory:
         flash_size: int = 0,
     ):
         # BNS replaces this with z-core's writable zero-copy RAM view.
-        self.ram: bytearray | memoryview = bytearray(ram_size)
+        self.ram = bytearray(ram_size)
         self.rom = bytearray(rom_size)
         self.flash = bytearray((0xFF,)) * flash_size
+        self._flash_size = flash_size
         self.high_bank_latch = 0
+        # Flash offset of logical window address 0, or None while the window
+        # is disabled; recomputed only when the latch changes.
+        self._flash_window_offset: int | None = None
         self._flash_command = "ready"
 
         # MMU registers
         self.cbr = 0x00  # Common Base Register
         self.bbr = 0x00  # Bank Base Register
         self.cbar = 0xF0  # Common/Bank Area Register (default: all common area 0)
+        # Common area 1 translation, derived from CBR/CBAR whenever they change
+        self.common1_start = 0xF000  # First logical address in common area 1
+        self.common1_base = 0x00000  # Physical offset added to common area 1
 
     def load_rom(self, data: bytes, offset: int = 0) -> None:
         """Initialize effective RAM and the retained firmware image."""
@@ -46,10 +72,13 @@ class Memory:
             raise ValueError("ROM image exceeds configured RAM size")
         if offset + len(data) > len(self.rom):
             raise ValueError("ROM image exceeds configured ROM size")
-        self.ram[:] = b"\x00" * len(self.ram)
-        self.rom[:] = b"\x00" * len(self.rom)
-        self.ram[offset : offset + len(data)] = data
-        self.rom[offset : offset + len(data)] = data
+        end = offset + len(data)
+        for image in (self.ram, self.rom):
+            # Clear only the bytes the image does not cover, in place.
+            cells = np.frombuffer(image, dtype=np.uint8)
+            cells[:offset] = 0
+            cells[end:] = 0
+            image[offset:end] = data
 
     def load_state(self, path: Path | str) -> None:
         """Load effective RAM, converting legacy shadow-RAM state when needed."""
@@ -95,10 +124,7 @@ class Memory:
         ram_end = header_size + bitmap_size + ram_size
         stored_ram = data[header_size + bitmap_size : ram_end]
         if legacy:
-            effective_ram = bytearray(self.ram)
-            for address, value in enumerate(stored_ram):
-                if address >= len(self.rom) or bitmap[address >> 3] & (1 << (address & 7)):
-                    effective_ram[address] = value
+            effective_ram = self._overlay_shadow(stored_ram, bitmap)
         else:
             effective_ram = stored_ram
 
@@ -116,9 +142,12 @@ class Memory:
                 len(self.flash).to_bytes(4, "little"),
             )
         )
-        data = b"".join((header, bytes(self.ram), bytes(self.flash)))
         temporary = path.with_name(f".{path.name}.tmp")
-        temporary.write_bytes(data)
+        # Write the live buffers directly rather than joining copies of them.
+        with temporary.open("wb") as file:
+            file.write(header)
+            file.write(self.ram)
+            file.write(self.flash)
         temporary.replace(path)
 
     def load_state_dir(self, path: Path | str) -> None:
@@ -147,10 +176,7 @@ class Memory:
                 raise ValueError(
                     f"state shadow bitmap is {len(shadow)} bytes; expected {expected_shadow_size}"
                 )
-            effective_ram = bytearray(self.ram)
-            for address, value in enumerate(ram):
-                if address >= len(self.rom) or shadow[address >> 3] & (1 << (address & 7)):
-                    effective_ram[address] = value
+            effective_ram = self._overlay_shadow(ram, shadow)
         else:
             effective_ram = ram
 
@@ -163,8 +189,8 @@ class Memory:
         path.mkdir(parents=True, exist_ok=True)
 
         components = {
-            "ram.bin": bytes(self.ram),
-            "flash.bin": bytes(self.flash),
+            "ram.bin": self.ram,
+            "flash.bin": self.flash,
         }
         for name, data in components.items():
             target = path / name
@@ -175,16 +201,42 @@ class Memory:
         if shadow_path.exists():
             shadow_path.unlink()
 
+    def _overlay_shadow(self, stored_ram: bytes, bitmap: bytes) -> bytes:
+        """Merge legacy shadow-RAM state into the current effective RAM.
+
+        Below the ROM size, a stored byte applies only where its shadow bit
+        (LSB first) records a write; above it, every stored byte applies.
+        """
+        written = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), bitorder="little")
+        written = written[: len(stored_ram)].astype(bool)
+        written[len(self.rom) :] = True
+        return np.where(
+            written,
+            np.frombuffer(stored_ram, dtype=np.uint8),
+            np.frombuffer(self.ram, dtype=np.uint8),
+        ).tobytes()
+
+    @property
+    def ram(self) -> bytearray | memoryview:
+        """Effective RAM, either qns-owned or z-core's adopted view."""
+        return self._ram
+
+    @ram.setter
+    def ram(self, ram: bytearray | memoryview) -> None:
+        # The length only changes with the buffer, so bounds checks on the
+        # access path compare against this rather than calling len().
+        self._ram = ram
+        self._ram_len = len(ram)
+
     def read(self, addr: int) -> int:
         """Read a byte from qns-owned physical storage."""
         addr &= 0xFFFFF  # 20-bit physical address
-
         flash_offset = self._flash_offset(addr)
         if flash_offset is not None:
             return self.flash[flash_offset]
 
-        if addr < len(self.ram):
-            return self.ram[addr]
+        if addr < self._ram_len:
+            return self._ram[addr]
         return 0xFF
 
     def write(self, addr: int, value: int):
@@ -195,23 +247,37 @@ class Memory:
             self._write_flash(flash_offset, value & 0xFF)
             return
 
-        if addr < len(self.ram):
-            self.ram[addr] = value & 0xFF
+        if addr < self._ram_len:
+            self._ram[addr] = value & 0xFF
+
+    def read_block(self, addr: int, length: int) -> bytes:
+        """Read consecutive physical bytes, copying plain RAM in one slice."""
+        addr &= 0xFFFFF
+        end = addr + length
+        window_offset = self._flash_window_offset
+        in_flash = (
+            window_offset is not None and addr < _FLASH_WINDOW_END and end > _FLASH_WINDOW_START
+        )
+        if not in_flash and end <= self._ram_len:
+            return bytes(self._ram[addr:end])
+        return bytes(self.read((addr + offset) & 0xFFFFF) for offset in range(length))
 
     def set_high_bank_latch(self, value: int) -> None:
         """Select the BSNEW 512 KiB flash page and enable state."""
         self.high_bank_latch = value & 0xFF
+        if self.flash and self.high_bank_latch & _FLASH_ENABLE:
+            page = self.high_bank_latch & 0x07
+            self._flash_window_offset = page * _FLASH_PAGE_SIZE - _FLASH_WINDOW_START
+        else:
+            self._flash_window_offset = None
 
     def _flash_offset(self, addr: int) -> int | None:
         """Translate the enabled BSNEW high-memory window into flash."""
-        if not self.flash or not self.high_bank_latch & _FLASH_ENABLE:
+        window_offset = self._flash_window_offset
+        if window_offset is None or not _FLASH_WINDOW_START <= addr < _FLASH_WINDOW_END:
             return None
-        if not _FLASH_WINDOW_START <= addr < _FLASH_WINDOW_START + _FLASH_PAGE_SIZE:
-            return None
-
-        page = self.high_bank_latch & 0x07
-        offset = page * _FLASH_PAGE_SIZE + addr - _FLASH_WINDOW_START
-        return offset if offset < len(self.flash) else None
+        offset = window_offset + addr
+        return offset if offset < self._flash_size else None
 
     def _write_flash(self, offset: int, value: int) -> None:
         """Apply the AMD command sequences emitted by BSNEW firmware."""
@@ -250,7 +316,7 @@ class Memory:
                 self.flash[:] = b"\xff" * len(self.flash)
             elif value == 0x30:
                 sector_start = offset - offset % _FLASH_SECTOR_SIZE
-                sector_end = min(sector_start + _FLASH_SECTOR_SIZE, len(self.flash))
+                sector_end = min(sector_start + _FLASH_SECTOR_SIZE, self._flash_size)
                 self.flash[sector_start:sector_end] = b"\xff" * (sector_end - sector_start)
             self._flash_command = "ready"
 
@@ -262,3 +328,31 @@ class Memory:
             self.bbr = bbr & 0xFF
         if cbar is not None:
             self.cbar = cbar & 0xFF
+        self.common1_start = (self.cbar >> 4) << 12
+        self.common1_base = self.cbr << 12
+
+    def cbr_read(self, port: int) -> int:
+        """Read the Common Base Register I/O port."""
+        return self.cbr
+
+    def cbr_write(self, port: int, value: int) -> None:
+        """Write the Common Base Register I/O port."""
+        self.cbr = value & 0xFF
+        self.common1_base = self.cbr << 12
+
+    def bbr_read(self, port: int) -> int:
+        """Read the Bank Base Register I/O port."""
+        return self.bbr
+
+    def bbr_write(self, port: int, value: int) -> None:
+        """Write the Bank Base Register I/O port."""
+        self.bbr = value & 0xFF
+
+    def cbar_read(self, port: int) -> int:
+        """Read the Common/Bank Area Register I/O port."""
+        return self.cbar
+
+    def cbar_write(self, port: int, value: int) -> None:
+        """Write the Common/Bank Area Register I/O port."""
+        self.cbar = value & 0xFF
+        self.common1_start = (self.cbar >> 4) << 12
@@ -92,6 +92,10 @@ PHONEMES: dict[int, tuple[str, str, str]] = {
     0x3F: ("LB", "LUBE", "l"),
 }
 
+# The phoneme register is six bits wide, so the codes index these directly.
+_PHONEME_ENTRIES = tuple(PHONEMES[code] for code in range(0x40))
+_PHONEME_NAMES = tuple(name for name, _, _ in _PHONEME_ENTRIES)
+
 
 # DURPHON mode selector values, shifted down from the datasheet's register
 # encoding (0xC0/0x80/0x40/0x00).
@@ -155,7 +159,7 @@ def playback_length_samples(
     return max(1, (samples * (16 - rate)) // (16 - _CAPTURE_RATE))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phoneme:
     """One captured SSI-263 phoneme with its datasheet description."""
 
@@ -165,7 +169,7 @@ class Phoneme:
     ipa: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SSI263State:
     """Decoded SSI-263 register state captured at one phoneme event."""
 
@@ -185,7 +189,7 @@ class SSI263State:
     transitioned_inflection: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DeferredWriteTiming:
     """One CPU-originated write awaiting z-core's exact I/O event cycle."""
 
@@ -199,7 +203,7 @@ class _DeferredWriteTiming:
     phoneme_end: _DeferredPhonemeEnd | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _DeferredPhonemeEnd:
     """Active phoneme state retained until an exact ending cycle arrives."""
 
@@ -253,6 +257,17 @@ class SSI263:
         self.base_port = base_port
         self.phoneme_log: list[int] = []
         self._clock = clock
+        # Register decoders indexed by port offset (REG_DURPHON..REG_FILTER).
+        self._register_writers = (
+            self._write_durphon,
+            self._write_inflect,
+            self._write_rateinf,
+            self._write_ctrlamp,
+            self._write_filter,
+        )
+        # Completion cycles per (phoneme, duration mode, rate), packed as
+        # phoneme << 6 | duration << 4 | rate; -1 until first computed.
+        self._duration_cycles = [-1] * 0x1000
 
         # Decoded register state at chip reset: transitioned-mode pause
         # phoneme, zero amplitude, filter silenced, standby.
@@ -418,24 +433,27 @@ class SSI263:
         * (4-dur) - is not this: it lives inside a LOG_SSI263B debug logger
         and only estimates a duration for a log line.  Using it here gave
         256 ms phonemes, roughly four times too long.
-        """
-        samples = playback_length_samples(
-            self.phoneme,
-            self.playback_duration,
-            self.rate,
-        )
-        if samples <= 0:
-            return 0
 
-        return int(samples * self._clock / _PHONEME_SAMPLE_RATE)
+        Each of the 4096 register combinations is computed once per chip.
+        """
+        duration = self.playback_duration
+        key = (self.phoneme << 6) | (duration << 4) | self.rate
+        cycles = self._duration_cycles[key]
+        if cycles < 0:
+            samples = playback_length_samples(self.phoneme, duration, self.rate)
+            cycles = int(samples * self._clock / _PHONEME_SAMPLE_RATE) if samples > 0 else 0
+            self._duration_cycles[key] = cycles
+        return cycles
 
     def check_pending_irq(self, current_cycle: int) -> None:
         """Complete a scheduled phoneme once its cycle is reached.
 
-        Call from the main loop.  Completion always raises A/!R (D7), even
-        when interrupts are disabled; INT1 is only asserted when the latched
-        mode enables them.
+        Call from the main loop.  The cycle also becomes the chip's current
+        cycle, so the loop needs no separate set_cycle_count() call.
+        Completion always raises A/!R (D7), even when interrupts are
+        disabled; INT1 is only asserted when the latched mode enables them.
         """
+        self._current_cycle = current_cycle
         if self._pending_irq_cycle is not None and current_cycle >= self._pending_irq_cycle:
             self._end_active_phoneme(self._pending_irq_cycle)
             self._pending_irq_cycle = None
@@ -476,48 +494,9 @@ class SSI263:
         generation_before = self._phoneme_generation
 
         try:
-            # Writes to registers 0-2 complete the handshake: they de-assert the
-            # interrupt and clear A/!R.
-            if reg <= self.REG_RATEINF:
-                self._d7 = False
-                if self._irq_callback:
-                    self._irq_callback(0)
-
-            if reg == self.REG_DURPHON:
-                self.duration = (value >> 6) & 0x03
-                self.phoneme = value & 0x3F
-                # If CTL=0 (not in standby), play the phoneme
-                if not self.control:
-                    self._speak_phoneme()
-
-            elif reg == self.REG_INFLECT:
-                # Bits I10:I3 of the 12-bit inflection value
-                self.inflection = (self.inflection & 0x807) | ((value & 0xFF) << 3)
-
-            elif reg == self.REG_RATEINF:
-                self.rate = (value >> 4) & 0x0F
-                # Bit 3 = I11, bits 2:0 = I2:I0
-                self.inflection = ((value & 0x08) << 8) | (self.inflection & 0x7F8) | (value & 0x07)
-
-            elif reg == self.REG_CTRLAMP:
-                was_standby = self.control
-                self.control = bool(value & 0x80)
-                self.articulation = (value >> 4) & 0x07
-                self.amplitude = value & 0x0F
-                if was_standby and not self.control:
-                    # CTL transition 1->0: latch the mode, then play the phoneme
-                    self._latch_mode_and_ints()
-                    self._speak_phoneme()
-                elif not was_standby and self.control:
-                    # CTL transition 0->1: standby de-asserts the interrupt too
-                    self._end_active_phoneme(self._current_cycle)
-                    self.speaking = False
-                    self._d7 = False
-                    if self._irq_callback:
-                        self._irq_callback(0)
-
-            elif reg == self.REG_FILTER:
-                self.filter_freq = value & 0xFF
+            # Offsets outside the five registers decode to nothing.
+            if 0 <= reg < len(self._register_writers):
+                self._register_writers[reg](value)
         finally:
             self._defer_current_write = False
 
@@ -530,7 +509,7 @@ class SSI263:
                 if generation is not None and self._pending_irq_cycle is not None
                 else 0
             )
-            name = PHONEMES.get(self.phoneme, ("?", "unknown", ""))[0]
+            name = _PHONEME_NAMES[self.phoneme]
             self._deferred_write_timings.append(
                 _DeferredWriteTiming(
                     port=port,
@@ -544,6 +523,56 @@ class SSI263:
                 )
             )
 
+    def _complete_handshake(self) -> None:
+        """De-assert the interrupt and clear A/!R, as writes to 0-2 do."""
+        self._d7 = False
+        if self._irq_callback:
+            self._irq_callback(0)
+
+    def _write_durphon(self, value: int) -> None:
+        """Decode DURPHON: duration mode and phoneme code."""
+        self._complete_handshake()
+        self.duration = (value >> 6) & 0x03
+        self.phoneme = value & 0x3F
+        # If CTL=0 (not in standby), play the phoneme
+        if not self.control:
+            self._speak_phoneme()
+
+    def _write_inflect(self, value: int) -> None:
+        """Decode INFLECT: inflection bits I10:I3."""
+        self._complete_handshake()
+        # Bits I10:I3 of the 12-bit inflection value
+        self.inflection = (self.inflection & 0x807) | ((value & 0xFF) << 3)
+
+    def _write_rateinf(self, value: int) -> None:
+        """Decode RATEINF: speech rate plus inflection bits I11 and I2:I0."""
+        self._complete_handshake()
+        self.rate = (value >> 4) & 0x0F
+        # Bit 3 = I11, bits 2:0 = I2:I0
+        self.inflection = ((value & 0x08) << 8) | (self.inflection & 0x7F8) | (value & 0x07)
+
+    def _write_ctrlamp(self, value: int) -> None:
+        """Decode CTRLAMP: CTL, articulation and amplitude."""
+        was_standby = self.control
+        self.control = bool(value & 0x80)
+        self.articulation = (value >> 4) & 0x07
+        self.amplitude = value & 0x0F
+        if was_standby and not self.control:
+            # CTL transition 1->0: latch the mode, then play the phoneme
+            self._latch_mode_and_ints()
+            self._speak_phoneme()
+        elif not was_standby and self.control:
+            # CTL transition 0->1: standby de-asserts the interrupt too
+            self._end_active_phoneme(self._current_cycle)
+            self.speaking = False
+            self._d7 = False
+            if self._irq_callback:
+                self._irq_callback(0)
+
+    def _write_filter(self, value: int) -> None:
+        """Decode FILTER: the filter frequency (0xFF silences output)."""
+        self.filter_freq = value & 0xFF
+
     def state(self) -> SSI263State:
         """Return a snapshot of the decoded register state."""
         return SSI263State(
@@ -566,8 +595,7 @@ class SSI263:
         self._active_phoneme_generation = self._phoneme_generation
 
         if self._on_phoneme and not self._defer_current_write:
-            name = PHONEMES.get(self.phoneme, ("?", "unknown", ""))[0]
-            self._on_phoneme(self.phoneme, name)
+            self._on_phoneme(self.phoneme, _PHONEME_NAMES[self.phoneme])
 
         # Mark as speaking while phoneme plays
         self.speaking = True
@@ -666,7 +694,7 @@ class SSI263:
         for code in self.phoneme_log[start:]:
             if not include_pauses and code == 0:
                 continue
-            name, example, ipa = PHONEMES.get(code, ("?", "unknown", ""))
+            name, example, ipa = _PHONEME_ENTRIES[code]
             result.append(Phoneme(code=code, name=name, example=example, ipa=ipa))
         return tuple(result)
 
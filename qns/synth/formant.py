@@ -106,6 +106,11 @@ class FormantSynth:
         self._fx = FilterCoeffs(a=[1.0], b=[1.0, 0.0])
         self._fn = FilterCoeffs(a=[0.0, 0.0, 0.0], b=[1.0, 0.0, 0.0])
 
+        # Built standard filters by capacitor values.  Only the F1, F2 and F3
+        # registers vary, so this holds a few hundred entries at most, and
+        # coarticulation keeps revisiting them.
+        self._standard_filters: dict[tuple[float, ...], FilterCoeffs] = {}
+
         # Filter history arrays (for IIR)
         self._voice_1 = [0.0] * 4
         self._voice_2 = [0.0] * 4
@@ -163,7 +168,7 @@ class FormantSynth:
         # _chip_update() runs on every other generated sample (MAME's
         # votrax.cpp sound_stream_update does the same).
         chip_samples = max(1, int(num_samples * self._sclock / self.sample_rate))
-        generated = np.zeros(chip_samples, dtype=np.float32)
+        generated = np.empty(chip_samples, dtype=np.float32)
         for i in range(chip_samples):
             if i & 1:
                 self._chip_update()
@@ -418,7 +423,16 @@ class FormantSynth:
         c3: float,
         c4: float,
     ) -> FilterCoeffs:
-        """Build standard 4th-order formant filter."""
+        """Build standard 4th-order formant filter.
+
+        Coefficients are never modified once built, so a filter for a
+        capacitor set is computed once and then shared.
+        """
+        key = (c1t, c1b, c2t, c2b, c3, c4)
+        cached = self._standard_filters.get(key)
+        if cached is not None:
+            return cached
+
         # Compute analog coefficients
         k0 = c1t / (self._cclock * c1b) if c1b else 0
         k1 = c4 * c2t / (self._cclock * c1b * c3) if (c1b and c3) else 0
@@ -450,6 +464,7 @@ class FormantSynth:
         f.b[2] = 3 - m1 - m2
         f.b[3] = 1 - m1 + m2
 
+        self._standard_filters[key] = f
         return f
 
     def _build_f1_filter(self) -> None:
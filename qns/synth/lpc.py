@@ -30,9 +30,12 @@ end-of-utterance flush.
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 
 from .phonemes import SAMPLE_RATE, get_phoneme_samples
+from .timing import silence
 
 ORDER = 14
 FRAME_MS = 5.0
@@ -168,17 +171,35 @@ def warm_analysis_cache() -> None:
         phoneme_params(code)
 
 
+@functools.lru_cache(maxsize=1024)
+def _resample_grid(
+    source_length: int,
+    length: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Neighbour indices and blend weights for one linear resampling shape.
+
+    Templates are only a few hundred samples and pitch periods repeat, so
+    the same few shapes recur every frame; caching them leaves two gathers
+    and one blend per call instead of rebuilding the grid for np.interp.
+    """
+    positions = np.linspace(0.0, source_length - 1, length)
+    left = np.minimum(positions.astype(np.intp), max(0, source_length - 2))
+    right = np.minimum(left + 1, source_length - 1)
+    weights = positions - left
+    for array in (left, right, weights):
+        array.flags.writeable = False
+    return left, right, weights
+
+
 def resample_template(template: np.ndarray, length: int) -> np.ndarray:
     """Stretch or squeeze one excitation period to the current pitch period."""
     if len(template) == 0:
         return np.zeros(length, dtype=np.float64)
     if len(template) == length:
         return template
-    return np.interp(
-        np.linspace(0.0, len(template) - 1, length),
-        np.arange(len(template)),
-        template,
-    )
+    left, right, weights = _resample_grid(len(template), length)
+    lower = template[left]
+    return lower + (template[right] - lower) * weights
 
 
 class LPCStream:
@@ -229,14 +250,15 @@ class LPCStream:
 
         `samples` comes from the chip's own duration model, so the audio
         produced here lasts exactly as long as the chip will hold the
-        phoneme before asking for the next one.
+        phoneme before asking for the next one.  A muted phoneme comes back
+        as a read-only view of shared silence.
         """
         if samples <= 0:
-            return np.zeros(0, dtype=np.float32)
+            return silence(0)
 
         gain_scale = max(0, min(15, amplitude)) / 15.0
         if gain_scale == 0.0:
-            return np.zeros(samples, dtype=np.float32)
+            return silence(samples)
         if code & 0x3F == 0:
             return self._render_silence(samples)
 
@@ -351,7 +373,8 @@ class LPCStream:
         taps = np.zeros(ORDER, dtype=np.float64)
         if self._previous is not None:
             taps = reflection_to_lpc(np.clip(self._previous["reflection"], -0.999, 0.999))[1:]
-        output = np.zeros(samples, dtype=np.float64)
+        # Every sample is written below, so skip zero-filling the buffer.
+        output = np.empty(samples, dtype=np.float64)
         for offset in range(samples):
             value = -float(taps @ history)
             history[1:] = history[:-1]
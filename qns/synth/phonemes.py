@@ -6,26 +6,33 @@ import numpy as np
 
 _ARCHIVE = Path(__file__).with_name("phonemes.npz")
 
+# Each member read decodes into a fresh array that owns its memory, so the
+# arrays outlive the archive without another copy.
 with np.load(_ARCHIVE, allow_pickle=False) as _archive:
     SAMPLE_RATE = int(_archive["sample_rate"])
-    _phoneme_info = _archive["phoneme_info"].copy()
-    PHONEME_DATA = _archive["phoneme_data"].copy()
+    _phoneme_info = _archive["phoneme_info"]
+    PHONEME_DATA = _archive["phoneme_data"]
 
 if _phoneme_info.shape != (62, 2) or _phoneme_info.dtype != np.dtype("<u4"):
     raise ValueError(f"invalid phoneme metadata in {_ARCHIVE}")
 if PHONEME_DATA.shape != (156_566,) or PHONEME_DATA.dtype != np.dtype("<i2"):
     raise ValueError(f"invalid phoneme sample data in {_ARCHIVE}")
 
+# Captures are handed out as views into this array, so freeze it.
+PHONEME_DATA.flags.writeable = False
+
 PHONEME_INFO: list[tuple[int, int]] = [
     (int(offset), int(length)) for offset, length in _phoneme_info
 ]
 del _phoneme_info
 
+# One read-only view per capture, cut once so lookups need no slicing.
+_CAPTURES = tuple(PHONEME_DATA[offset : offset + length] for offset, length in PHONEME_INFO)
+
 
 def get_phoneme_samples(phoneme_index: int) -> np.ndarray:
-    """Return the signed 16-bit samples for one phoneme capture."""
+    """Return a read-only view of the signed 16-bit samples for one capture."""
     if not 0 <= phoneme_index < len(PHONEME_INFO):
         raise ValueError(f"Invalid phoneme index {phoneme_index}, must be 0-61")
 
-    offset, length = PHONEME_INFO[phoneme_index]
-    return PHONEME_DATA[offset : offset + length]
+    return _CAPTURES[phoneme_index]
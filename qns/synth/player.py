@@ -61,6 +61,7 @@ class AudioPlayer:
         max_buffer_ms: int = 1000,
         overflow_policy: Literal["block", "drop_newest"] = "drop_newest",
         log_path: Path | str | None = None,
+        latency: Literal["low", "high"] | float = "high",
     ):
         if sample_rate <= 0:
             raise ValueError("sample_rate must be positive")
@@ -74,19 +75,32 @@ class AudioPlayer:
             raise ValueError("max_buffer_ms must be positive")
         if overflow_policy not in ("block", "drop_newest"):
             raise ValueError(f"unsupported overflow policy: {overflow_policy}")
+        if isinstance(latency, str):
+            if latency not in ("low", "high"):
+                raise ValueError(f"unsupported latency hint: {latency}")
+        elif latency <= 0:
+            raise ValueError("latency must be positive")
 
         # 512 frames is 23 ms of headroom, which PulseAudio under WSL does
         # not reliably meet while the emulator thread holds the GIL between
         # sleeps; 2048 gives 93 ms.  The ring itself never starves the
         # callback - it pads with silence - so underruns here are host
-        # scheduling jitter, not missing audio.
+        # scheduling jitter, not missing audio.  PortAudio's latency hint
+        # trades the same way: "low" answers sooner but leaves the host less
+        # slack before a glitch, so it suits a dedicated machine; a number
+        # of seconds pins it exactly.
         self.sample_rate = sample_rate
         self.channels = channels
         self.blocksize = blocksize
+        self.latency = latency
 
         self._stream: Any | None = None
         self._lock = threading.Lock()
         self._space_available = threading.Condition(self._lock)
+        # Set whenever is_playing() would report False, so waiters wake on
+        # the callback that drains the ring instead of polling for it.
+        self._drained = threading.Event()
+        self._drained.set()
         self._playing = False
         self._queued_frames = 0
         self._read_index = 0
@@ -146,7 +160,7 @@ class AudioPlayer:
             channels=self.channels,
             blocksize=self.blocksize,
             dtype=np.float32,
-            latency="high",
+            latency=self.latency,
             callback=self._audio_callback,
         )
         self._log_event("stream_start")
@@ -180,16 +194,15 @@ class AudioPlayer:
         """Queue samples for playback and return the accepted frame count.
 
         Args:
-            samples: Audio samples (float32, -1.0 to 1.0)
+            samples: Audio samples (-1.0 to 1.0; converted to float32 in the ring)
 
         With ``drop_newest``, only the prefix that fits is accepted and the
         remaining newest frames are counted by :attr:`dropped_frames`.
         ``block`` waits for callback consumption and aborts if :meth:`stop`
         closes the current producer generation.
         """
-        if samples.dtype != np.float32:
-            samples = samples.astype(np.float32)
-
+        # The ring copies convert other dtypes to float32 as they store, so
+        # no converted intermediate of the whole buffer is needed.
         accepted = 0
         dropped = 0
         with self._space_available:
@@ -219,8 +232,10 @@ class AudioPlayer:
             if accepted < len(samples) and (not self._accepting or generation != self._generation):
                 dropped = len(samples) - accepted
 
-            if accepted and len(samples) > 1:
-                self._substantive_audio_queued = True
+            if accepted:
+                self._drained.clear()
+                if len(samples) > 1:
+                    self._substantive_audio_queued = True
             queued_frames = self._queued_frames
             priming = self._priming
 
@@ -247,9 +262,22 @@ class AudioPlayer:
             return missing / self.sample_rate
 
     def is_playing(self) -> bool:
-        """Check if audio is currently playing."""
-        with self._lock:
-            return self._playing or self._queued_frames > 0
+        """Check if audio is currently playing.
+
+        This is a polling hint, so it reads without the ring lock: each
+        attribute load is atomic under the GIL, and a stale answer only
+        delays the caller's next poll instead of contending with the
+        audio callback.
+        """
+        return self._playing or self._queued_frames > 0
+
+    def wait_until_drained(self, timeout: float | None = None) -> bool:
+        """Block until queued audio has played out or ``timeout`` expires.
+
+        Returns whether the player drained.  :meth:`stop` also releases
+        waiters, since it discards whatever was still queued.
+        """
+        return self._drained.wait(timeout)
 
     @property
     def dropped_frames(self) -> int:
@@ -265,7 +293,6 @@ class AudioPlayer:
         status,
     ) -> None:
         """Fill one PortAudio block with at most two bounded ring copies."""
-        outdata.fill(0)
         with self._space_available:
             if self._priming:
                 if self._queued_frames >= self._prime_frames:
@@ -301,8 +328,14 @@ class AudioPlayer:
 
             self._playing = audio_frames == frames
             queued_frames = self._queued_frames
+            if not self._playing and not queued_frames:
+                self._drained.set()
             priming = self._priming
 
+        # Only the frames the ring could not supply need silence.
+        if audio_frames < frames:
+            outdata[audio_frames:frames] = 0
+
         # Logging is deliberately outside the callback state lock.  This
         # queues raw values only; CSV/string formatting belongs to the writer.
         self._log_event(
@@ -319,6 +352,7 @@ class AudioPlayer:
 
     def _reset_ring_locked(self) -> None:
         self._playing = False
+        self._drained.set()
         self._queued_frames = 0
         self._read_index = 0
         self._write_index = 0
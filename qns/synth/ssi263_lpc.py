@@ -15,7 +15,7 @@ import numpy as np
 from ..ssi263 import SSI263State, playback_length_samples
 from .lpc import SAMPLE_RATE, LPCStream, warm_analysis_cache
 from .player import AudioPlayer
-from .timing import conform_audio_to_length, fit_audio_to_elapsed
+from .timing import conform_audio_to_length, fit_audio_to_elapsed, silence
 
 
 class SSI263LPCSynth:
@@ -111,7 +111,7 @@ class SSI263LPCSynth:
         if phoneme & 0x3F == 0:
             # Preserve LPC continuity while representing the modeled pause;
             # end_phoneme will truncate this to the time that actually passed.
-            samples = np.zeros(sample_count, dtype=np.float32)
+            samples = silence(sample_count)
         else:
             samples = self._stream.render(phoneme & 0x3F, sample_count, amplitude)
 
@@ -128,7 +128,7 @@ class SSI263LPCSynth:
         """Render only the LPC state that could have played before its end."""
         elapsed_samples = max(0, elapsed_samples)
         if phoneme & 0x3F == 0:
-            return np.zeros(elapsed_samples, dtype=np.float32)
+            return silence(elapsed_samples)
 
         modeled_samples = playback_length_samples(phoneme, duration, rate)
         rendered = self._stream.render(
@@ -8,10 +8,12 @@ import numpy as np
 from ..ssi263 import SSI263State, playback_length_samples
 from .phonemes import PHONEME_INFO, SAMPLE_RATE, get_phoneme_samples
 from .player import AudioPlayer
-from .timing import conform_audio_to_length, fit_audio_to_elapsed
+from .timing import conform_audio_to_length, fit_audio_to_elapsed, silence
 
 _NORMAL_INFLECTION = 3072
 _NORMAL_INFLECTION_TARGET = 16
+# Rendered (phoneme, amplitude, duration, rate) shapes kept for reuse.
+_RENDER_CACHE_SIZE = 256
 
 
 class SSI263PCMSynth:
@@ -45,6 +47,7 @@ class SSI263PCMSynth:
         self._inflection_frames_remaining = 0
         self._last_inflection_setting: int | None = None
         self._pending_audio: np.ndarray | None = None
+        self._rendered: dict[tuple[int, int, int, int], np.ndarray] = {}
 
     def start(self) -> None:
         """Start the host audio stream when audio output is enabled."""
@@ -116,8 +119,11 @@ class SSI263PCMSynth:
         if duration <= 0 or len(samples) == 0:
             return samples
         if duration == 1:
-            keep = np.arange(len(samples)) % 4 != 3
-            return samples[keep]
+            # View whole groups of four, keep three columns, then append the
+            # short tail, which never reaches a fourth sample.
+            whole = len(samples) - len(samples) % 4
+            kept = samples[:whole].reshape(-1, 4)[:, :3].reshape(-1)
+            return np.concatenate((kept, samples[whole:]))
 
         group = 2 if duration == 2 else 4
         usable = (len(samples) // group) * group
@@ -204,18 +210,28 @@ class SSI263PCMSynth:
             )
             synthesis_mark += period / ratios[ratio_index]
 
+        # Pick every grain's nearest analysis mark in one pass; ties go to
+        # the earlier mark, as a per-grain argmin would.
+        marks = np.asarray(synthesis_marks)
+        upper = np.clip(np.searchsorted(analysis_marks, marks), 1, len(analysis_marks) - 1)
+        lower = upper - 1
+        nearest = np.where(
+            marks - analysis_marks[lower] <= analysis_marks[upper] - marks,
+            lower,
+            upper,
+        )
+
         radius = period
         window = np.hanning(radius * 2 + 1)
         padded = np.pad(samples.astype(np.float64), (radius, radius))
         output = np.zeros(len(samples), dtype=np.float64)
         weight = np.zeros(len(samples), dtype=np.float64)
 
-        for synthesis_mark in synthesis_marks:
+        for synthesis_mark, source_index in zip(synthesis_marks, nearest.tolist()):
             center = int(round(synthesis_mark))
             if center - radius >= len(samples):
                 break
 
-            source_index = int(np.argmin(np.abs(analysis_marks - synthesis_mark)))
             source_center = int(analysis_marks[source_index]) + radius
             grain = padded[source_center - radius : source_center + radius + 1]
 
@@ -295,13 +311,46 @@ class SSI263PCMSynth:
         is pause.  Code 1 has no distinct capture, so this approximate backend
         uses the adjacent code-2 capture rather than substituting another
         synthesizer architecture.
+
+        Without a transitioned inflection the result depends only on the
+        arguments, so it is rendered once, cached and returned read-only.
         """
+        if transitioned_inflection:
+            return self._render_phoneme_audio(
+                phoneme, amplitude, duration, rate, inflection, transitioned_inflection
+            )
+
+        key = (phoneme, max(0, min(15, amplitude)), duration, rate)
+        audio = self._rendered.get(key)
+        if audio is None:
+            audio = self._render_phoneme_audio(phoneme, key[1], duration, rate)
+            audio.flags.writeable = False
+            if len(self._rendered) >= _RENDER_CACHE_SIZE:
+                del self._rendered[next(iter(self._rendered))]
+            self._rendered[key] = audio
+        return audio
+
+    def _render_phoneme_audio(
+        self,
+        phoneme: int,
+        amplitude: int,
+        duration: int,
+        rate: int,
+        inflection: int = _NORMAL_INFLECTION,
+        transitioned_inflection: bool = False,
+    ) -> np.ndarray:
+        """Render one phoneme through duration, rate, inflection and gain."""
         code = phoneme & 0x3F
+        length = playback_length_samples(phoneme, duration, rate)
+        amplitude = max(0, min(15, amplitude))
+        if not transitioned_inflection and (code == 0 or amplitude == 0):
+            # Pauses and muted phonemes come out silent whatever the capture
+            # or gain.  Only a transitioned inflection has to run, because it
+            # advances the pitch glide.
+            return silence(length)
+
         if code == 0:
-            samples = np.zeros(
-                playback_length_samples(phoneme, duration, rate),
-                dtype=np.float32,
-            )
+            samples = np.zeros(length, dtype=np.float32)
         else:
             if code == 1:
                 code = 2
@@ -312,13 +361,8 @@ class SSI263PCMSynth:
             else:
                 samples = get_phoneme_samples(data_index).astype(np.float32)
                 samples = self._apply_duration(samples, duration)
-                target_length = playback_length_samples(
-                    phoneme,
-                    duration,
-                    rate,
-                )
-                if target_length != len(samples):
-                    samples = self._apply_rate(samples, target_length)
+                if length != len(samples):
+                    samples = self._apply_rate(samples, length)
 
         if transitioned_inflection:
             samples = self._apply_transitioned_inflection(
@@ -327,12 +371,11 @@ class SSI263PCMSynth:
                 max(1, 4 - duration),
             )
 
-        samples = conform_audio_to_length(
-            samples,
-            playback_length_samples(phoneme, duration, rate),
-        )
-        gain = max(0, min(15, amplitude)) / 15.0
-        return samples * (gain / 32768.0)
+        samples = conform_audio_to_length(samples, length)
+        # Every stage above hands back a buffer this call owns (the capture
+        # was copied by astype), so the gain can be applied in place.
+        samples *= amplitude / 15.0 / 32768.0
+        return samples
 
     def _emit(
         self,
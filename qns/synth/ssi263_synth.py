@@ -5,7 +5,6 @@ translating SSI-263 (SC-02) phoneme codes to SC-01 codes.
 See docs/sc02-phoneme-mapping.md for the mapping provenance.
 """
 
-import time
 from collections.abc import Callable
 
 import numpy as np
@@ -14,7 +13,7 @@ from ..ssi263 import SSI263State, playback_length_samples
 from .formant import FormantSynth
 from .player import AudioPlayer
 from .sc02_to_sc01 import SC02_TO_SC01
-from .timing import conform_audio_to_length, fit_audio_to_elapsed
+from .timing import conform_audio_to_length, fit_audio_to_elapsed, silence
 
 
 def _sc01_inflection(inflection: int) -> int:
@@ -105,9 +104,28 @@ class SSI263Synth:
         self._emit(phoneme & 0x3F, self.amplitude, self.inflection)
 
     def speak_phonemes(self, phonemes: list[int]) -> None:
-        """Speak a sequence of phonemes with the standalone settings."""
-        for phoneme in phonemes:
-            self.speak_phoneme(phoneme)
+        """Speak a sequence of phonemes with the standalone settings.
+
+        The whole sequence is rendered first and queued as one buffer, so
+        the player takes a single write instead of one per phoneme.
+        """
+        codes = [phoneme & 0x3F for phoneme in phonemes]
+        if self._phoneme_callback is not None:
+            for code in codes:
+                self._phoneme_callback(code)
+        if self._player is not None and codes:
+            self._player.play(
+                np.concatenate(
+                    [
+                        self.get_phoneme_audio(
+                            code,
+                            amplitude=self.amplitude,
+                            inflection=self.inflection,
+                        )
+                        for code in codes
+                    ]
+                )
+            )
 
     def set_pitch(self, pitch: float) -> None:
         """Set the standalone pitch as a multiplier (1.0 = normal)."""
@@ -130,8 +148,8 @@ class SSI263Synth:
 
     def wait_until_done(self) -> None:
         """Block until speech completes."""
-        while self.is_speaking():
-            time.sleep(0.01)
+        if self._player is not None:
+            self._player.wait_until_drained()
 
     def get_phoneme_audio(
         self,
@@ -149,7 +167,7 @@ class SSI263Synth:
         code = phoneme & 0x3F
         target_length = playback_length_samples(code, duration, rate)
         if code == 0:
-            samples = np.zeros(target_length, dtype=np.float32)
+            samples = silence(target_length)
         else:
             samples = self._formant.synthesize_phoneme(
                 phoneme=SC02_TO_SC01[code],
@@ -160,8 +178,9 @@ class SSI263Synth:
             target_length,
         )
         gain = max(0, min(15, amplitude)) / 15.0
-        if gain < 1.0:
-            samples = samples * gain
+        if gain < 1.0 and code != 0:
+            # The formant model hands back a fresh buffer, so scale it in place.
+            samples *= gain
         return samples
 
     def _emit(self, phoneme: int, amplitude: int, inflection: int) -> None:
@@ -4,26 +4,46 @@ from __future__ import annotations
 
 import numpy as np
 
+# Shared read-only zeros that every pause is sliced from; grown on demand.
+_silence = np.zeros(0, dtype=np.float32)
+
+
+def silence(sample_count: int) -> np.ndarray:
+    """Return a read-only run of float32 silence shared between callers."""
+    global _silence
+    sample_count = max(0, sample_count)
+    if sample_count > len(_silence):
+        _silence = np.zeros(max(sample_count, 2 * len(_silence)), dtype=np.float32)
+        _silence.flags.writeable = False
+    return _silence[:sample_count]
+
 
 def _seamless_loop(samples: np.ndarray) -> tuple[np.ndarray, float]:
-    """Return a cyclic copy whose joins stay within the source's native steps."""
+    """Return a cyclic loop whose joins stay within the source's native steps.
+
+    The loop is read-only to callers, so a source that needs no blend is
+    returned as is rather than copied.
+    """
     if len(samples) < 2:
-        return samples.copy(), 0.0
+        return samples, 0.0
 
     source = samples.astype(np.float64)
     native_max = float(np.abs(np.diff(source)).max())
     boundary = float(source[-1])
     tolerance = native_max * 1e-6 + 1e-12
 
+    # Each attempt rewrites a longer prefix than the last, so one working
+    # copy serves every overlap.  Past the blended prefix the steps are the
+    # source's own, so only the prefix and its far edge need checking.
+    loop = samples.copy()
     for overlap in range(1, len(samples)):
         ramp = (np.arange(overlap, dtype=np.float64) + 1.0) / (overlap + 1.0)
-        loop = samples.copy()
         loop[:overlap] = (boundary * (1.0 - ramp) + source[:overlap] * ramp).astype(samples.dtype)
-        joined = np.concatenate(([boundary], loop.astype(np.float64)))
+        joined = np.concatenate(([boundary], loop[: overlap + 1].astype(np.float64)))
         if float(np.abs(np.diff(joined)).max()) <= native_max + tolerance:
             return loop, native_max
 
-    return samples.copy(), native_max
+    return samples, native_max
 
 
 def _energy_matched_extension(samples: np.ndarray, sample_count: int) -> np.ndarray:
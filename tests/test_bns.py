@@ -1176,6 +1176,87 @@ def test_address_trace_retains_causal_write_event_once():
     assert bns.traced_writes == [(12, 0x0002, 0xF000, 0x5A)]
 
 
+@pytest.mark.parametrize(
+    ("address_range", "traced"),
+    (
+        ((0xF000, 0xF0FF), [0xF000, 0xF0FF]),
+        ((0xFFFF0, 0xFFFFF), [0xFFFF0, 0xFFFFF]),
+        ((-1, 0x10), [0x00000, 0x00010]),
+        ((0xF0FF, 0xF000), []),
+    ),
+)
+def test_address_range_trace_matches_inclusive_ends_without_wrapping(
+    address_range,
+    traced,
+):
+    """Only start <= address <= end is traced; nothing wraps past 20 bits."""
+    bns = BNS(core="direct", trace_writes_range=address_range)
+
+    for addr in (0x00000, 0x00010, 0x00011, 0xEFFF, 0xF000, 0xF0FF, 0xF100, 0xFFFF0, 0xFFFFF):
+        bns._trace_write(addr, 0x5A, 0, 0)
+
+    assert [addr for _cycle, _pc, addr, _value in bns.traced_writes] == traced
+
+
+def test_dump_writes_counts_hot_addresses_past_32_bits(tmp_path):
+    """A long --dump-writes run must not wrap a hot address's count."""
+    path = tmp_path / "writes.csv"
+    bns = BNS(core="direct", dump_writes_file=str(path))
+    bns.write_counts[0xF000] = 1 << 32
+
+    bns._trace_write(0xF000, 0x5A, 0, 0)
+    bns.dump_trace_data()
+
+    assert path.read_text() == "address,count\n0x0F000,4294967297\n"
+
+
+def test_first_writes_log_keeps_only_the_first_n_writes(capsys):
+    """--trace-first-writes grows with the writes seen, up to its limit."""
+    bns = BNS(core="direct", trace_first_writes=1_000_000_000)
+    assert bns.write_log == []
+
+    bns = BNS(core="direct", trace_first_writes=2)
+    for addr, value in ((0xF000, 0x5A), (0x4_1A32, 0xA5), (0xF002, 0x01)):
+        bns._trace_write(addr, value, 0, 0)
+    bns.dump_trace_data()
+
+    assert bns.write_log == [(0xF000, 0x5A), (0x4_1A32, 0xA5)]
+    assert capsys.readouterr().out == (
+        "\n=== First 2 Memory Writes ===\n  1. 0x0F000 = 0x5A\n  2. 0x41A32 = 0xA5\n"
+    )
+
+
+def test_negative_first_writes_count_is_rejected(tmp_path, monkeypatch):
+    with pytest.raises(ValueError, match="trace_first_writes"):
+        BNS(core="direct", trace_first_writes=-1)
+
+    rom = tmp_path / "idle.rom"
+    rom.write_bytes(b"\x18\xfe")
+    monkeypatch.setattr("qns.cli.BNS", Mock(side_effect=AssertionError("BNS was constructed")))
+    with pytest.raises(SystemExit):
+        bns_main([str(rom), "--trace-first-writes", "-1"])
+
+
+def test_interrupted_compat_run_still_publishes_buffered_write_traces(capsys):
+    """A run cut short by an exception keeps the writes it already observed."""
+    bns = BNS(core="compat", trace_writes=0xF000)
+    cpu = Mock(instruction_pc=0x0002, cycle_count=12)
+
+    def interrupted_run(_cycles):
+        bns._mem_write(0xF000, 0x5A)
+        raise KeyboardInterrupt
+
+    cpu.run.side_effect = interrupted_run
+    bns.cpu = cpu
+
+    with pytest.raises(KeyboardInterrupt):
+        bns._execute_budget(100)
+
+    assert capsys.readouterr().out == "[TRACE] Write 0x0F000 = 0x5A\n"
+    assert bns.stats["writes"] == 1
+    assert bns.traced_writes == [(12, 0x0002, 0xF000, 0x5A)]
+
+
 def test_speech_and_memory_write_observers_share_native_cycle_order():
     """Speech callbacks and writes from one run use z-core's executed clock."""
     bns = BNS(
@@ -1587,7 +1668,9 @@ def test_direct_machine_uses_each_profile_region_contract(model, flash_size):
     """Each direct machine owns low RAM and maps only real flash apertures."""
     bns = BNS(model=model, core="direct")
 
-    assert isinstance(bns.memory.ram, memoryview)
+    # Adoption means one buffer: a store through z-core's view shows up here.
+    bns.cpu.ram(0x00000)[0] = 0xA5
+    assert bns.memory.ram[0] == 0xA5
     assert len(bns.memory.ram) == PROFILES[model].ram_size
     assert len(bns.memory.rom) == PROFILES[model].rom_size
     assert len(bns.memory.flash) == flash_size
@@ -10,6 +10,7 @@ from qns.devices import (
     BQ2010GasGauge,
     BrailleDisplay,
     BrailleKeyboard,
+    IOBus,
     ParallelBrailleDisplay,
     PIC16C56Clock,
     TNSKeyboard,
@@ -506,3 +507,41 @@ def test_keyboard_release_latches_chord_until_interrupt_acknowledge():
 
     assert keyboard.read(keyboard.port) == 0x00
     assert irq_states == [1, 0, 1, 0]
+
+
+@given(st.integers(min_value=0, max_value=0xFFFF), st.integers(min_value=0, max_value=0xFF))
+def test_io_bus_dispatches_on_the_low_port_byte_and_floats_unmapped_ports(port, value):
+    """A 16-bit Z180 port address reaches the handler for its low byte."""
+    bus = IOBus()
+    bus.logging = False
+    writes: list[tuple[int, int]] = []
+    bus.register(0x40, lambda p: 0x5A, lambda p, v: writes.append((p, v)))
+
+    bus.write(port, value)
+
+    if port & 0xFF == 0x40:
+        assert bus.read(port) == 0x5A
+        assert writes == [(0x40, value)]
+    else:
+        assert bus.read(port) == 0xFF
+        assert writes == []
+
+
+def test_io_bus_log_is_off_by_default_and_keeps_the_latest_accesses():
+    """Tracing is opt-in, and a long drain interval cannot grow the log without bound."""
+    bus = IOBus()
+    bus.write(0x38, 0x12)
+    assert bus.dump_log() == []
+
+    bus.logging = True
+    for value in range(5000):
+        bus.write(0x38, value)
+    bus.read(0x39)
+
+    log = bus.dump_log()
+    assert len(log) == 4096
+    assert log[-2:] == ["W port=38 val=87", "R port=39 val=FF"]
+    assert bus.dump_log(last_n=1) == ["R port=39 val=FF"]
+
+    bus.clear_log()
+    assert bus.dump_log() == []
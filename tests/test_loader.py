@@ -11,6 +11,7 @@ from qns.loader import (
     find_english_boundary,
     find_input_boundary,
     find_speech_parameters,
+    load_firmware,
 )
 
 # BSPMON.ASM::ISSET exactly as linked into roms/bspeng.bns at 0x02D7.
@@ -405,3 +406,20 @@ def test_claude_documents_that_warm_reset_legitimately_reverts_speech_settings()
     documentation = (Path(__file__).resolve().parents[1] / "CLAUDE.md").read_text(encoding="utf-8")
 
     assert "warm reset legitimately reverts retained speech settings" in documentation.lower()
+
+
+def test_load_firmware_reuses_an_unchanged_file_and_rereads_a_rewritten_one(
+    tmp_path,
+    monkeypatch,
+):
+    rom = tmp_path / "firmware.bns"
+    rom.write_bytes(b"\x01\x02\x03")
+
+    first = load_firmware(rom)
+    assert load_firmware(str(rom)) is first
+    monkeypatch.chdir(tmp_path)
+    assert load_firmware("firmware.bns") is first
+    assert load_firmware(Path("..") / tmp_path.name / "firmware.bns") is first
+
+    rom.write_bytes(b"\x04\x05\x06\x07")
+    assert load_firmware(rom).data == b"\x04\x05\x06\x07"
@@ -115,6 +115,46 @@ def test_bsnew_high_bank_latch_selects_flash_pages():
     assert memory.read(0x81234) == 0xFF
 
 
+def test_read_block_matches_bytewise_reads_across_ram_and_flash():
+    memory = Memory(flash_size=1024 * 1024)
+    memory.ram[0x7FFFE:0x80000] = b"\x11\x22"
+    _program_flash_byte(memory, 0, 0x33)
+    memory.set_high_bank_latch(0)
+
+    assert memory.read_block(0x7FFFE, 3) == b"\x11\x22\xff"
+    memory.set_high_bank_latch(0x08)
+    assert memory.read_block(0x7FFFE, 3) == b"\x11\x22\x33"
+    assert memory.read_block(0x7FFFE, 3) == bytes(
+        memory.read(0x7FFFE + offset) for offset in range(3)
+    )
+
+
+def test_adopted_ram_view_sets_the_unmapped_boundary():
+    assert Memory(ram_size=0).read(0) == 0xFF
+    memory = Memory(ram_size=16)
+    assert memory.read(16) == 0xFF
+
+    memory.ram = memoryview(bytearray(32))
+    memory.write(20, 0x5A)
+    memory.write(32, 0xA5)
+
+    assert memory.read(20) == 0x5A
+    assert memory.read(32) == 0xFF
+    assert len(memory.ram) == 32
+
+
+def test_physical_addresses_wrap_at_20_bits():
+    memory = Memory()
+    memory.write(0x100005, 0x5A)
+    memory.write(-1, 0xA5)
+
+    assert memory.read(5) == 0x5A
+    assert memory.read(0x100005) == 0x5A
+    assert memory.read(-1) == 0xFF
+    assert memory.ram[-1] == 0x00
+    assert memory.read_block(0x100005, 1) == b"\x5a"
+
+
 def test_bsnew_flash_program_and_erase_sequences():
     memory = Memory(flash_size=2 * 1024 * 1024)
     _program_flash_byte(memory, 0x01234, 0x00)
@@ -236,10 +276,10 @@ def test_legacy_state_imports_into_direct_machine_ram(tmp_path, magic):
 
     bns.load_state(state_path)
 
-    assert isinstance(bns.memory.ram, memoryview)
-    assert bns.memory.ram[0] == 0x11
-    assert bns.memory.ram[1] == 0xBB
-    assert bns.memory.ram[len(bns.memory.rom)] == 0x5A
+    native_ram = bns.cpu.ram(0x00000)
+    assert native_ram[0] == 0x11
+    assert native_ram[1] == 0xBB
+    assert native_ram[len(bns.memory.rom)] == 0x5A
 
 
 @pytest.mark.parametrize("model", ["bs2", "bl4"])
@@ -259,9 +299,9 @@ def test_v3_state_round_trip_preserves_direct_ram_and_flash(
     restored.memory.load_rom(bytes((0xAA, 0xBB)))
     restored.load_state(state_path)
 
-    assert isinstance(restored.memory.ram, memoryview)
-    assert restored.memory.ram[0] == 0x11
-    assert restored.memory.ram[1] == 0xBB
+    native_ram = restored.cpu.ram(0x00000)
+    assert native_ram[0] == 0x11
+    assert native_ram[1] == 0xBB
     assert restored.memory.flash[-1] == 0x5A
 
 
@@ -20,6 +20,7 @@ def fake_output_stream(monkeypatch):
 
     class OutputStream:
         def __init__(self, **kwargs):
+            self.kwargs = kwargs
             self.callback = kwargs["callback"]
             self.started = False
             self.stopped = False
@@ -132,6 +133,43 @@ def test_no_realtime_drop_newest_policy_caps_latency_and_reports_drops() -> None
     np.testing.assert_array_equal(output[:, 0], [0, 1, 2, 3])
 
 
+def test_wait_until_drained_wakes_on_the_callback_that_empties_the_ring() -> None:
+    player = AudioPlayer(
+        sample_rate=1_000,
+        blocksize=4,
+        prime_ms=0,
+        max_buffer_ms=8,
+        overflow_policy="drop_newest",
+    )
+    assert player.wait_until_drained(timeout=0)
+
+    player.play(np.ones(6, dtype=np.float32))
+    assert not player.wait_until_drained(timeout=0)
+
+    waiter = threading.Thread(target=player.wait_until_drained)
+    waiter.start()
+    player._audio_callback(_output(4), 4, None, None)
+    assert not player.wait_until_drained(timeout=0)
+    player._audio_callback(_output(4), 4, None, None)
+    waiter.join(timeout=1)
+
+    assert not waiter.is_alive()
+    assert not player.is_playing()
+
+
+def test_latency_hint_reaches_the_output_stream(fake_output_stream) -> None:
+    for latency in ("high", "low", 0.05):
+        player = AudioPlayer(latency=latency)
+        player.start()
+        assert fake_output_stream[-1].kwargs["latency"] == latency
+        player.stop()
+
+    with pytest.raises(ValueError, match="latency"):
+        AudioPlayer(latency="lowest")
+    with pytest.raises(ValueError, match="latency"):
+        AudioPlayer(latency=0)
+
+
 def test_stop_releases_blocked_producer_and_resets_restart_state(
     fake_output_stream,
 ) -> None:
@@ -28,6 +28,18 @@ def test_chip_decodes_all_register_fields() -> None:
     assert chip.filter_freq == 0x42
 
 
+def test_chip_ignores_writes_outside_its_register_window() -> None:
+    chip = SSI263()
+    chip.write(chip.base_port + chip.REG_FILTER, 0x42)
+
+    chip.write(chip.base_port + chip.REG_FILTER + 1, 0x00)
+    chip.write(chip.base_port - 1, 0x00)
+
+    assert chip.filter_freq == 0x42
+    assert chip.phoneme == 0
+    assert chip.amplitude == 0
+
+
 def test_chip_inflection_write_preserves_i11() -> None:
     chip = SSI263()
 
@@ -60,12 +60,23 @@ def test_pcm_backend_uses_captured_ssi263_samples() -> None:
     )
 
 
+def test_pcm_backend_reuses_rendered_phonemes_read_only() -> None:
+    synth = SSI263PCMSynth(audio_enabled=False)
+
+    first = synth.get_phoneme_audio(2, amplitude=15, duration=1, rate=8)
+
+    assert synth.get_phoneme_audio(2, amplitude=15, duration=1, rate=8) is first
+    assert not first.flags.writeable
+    assert synth.get_phoneme_audio(2, amplitude=7, duration=1, rate=8) is not first
+
+
 def test_pcm_backend_honors_zero_amplitude() -> None:
     synth = SSI263PCMSynth(audio_enabled=False)
 
     assert np.any(synth.get_phoneme_audio(2, amplitude=15))
     assert not np.any(synth.get_phoneme_audio(2, amplitude=0))
     assert not np.any(synth.get_phoneme_audio(0, amplitude=15))
+    assert len(synth.get_phoneme_audio(2, amplitude=0, rate=3)) == playback_length_samples(2, 0, 3)
 
 
 def test_pcm_backend_uses_rate_dependent_playback_length() -> None:
@@ -93,6 +93,16 @@ def test_get_phoneme_samples():
     assert len(samples) == PHONEME_INFO[61][1]
 
 
+def test_get_phoneme_samples_returns_read_only_views():
+    """Captures are views into the shared archive data, not copies."""
+    from qns.synth.phonemes import PHONEME_DATA, get_phoneme_samples
+
+    samples = get_phoneme_samples(5)
+
+    assert np.shares_memory(samples, PHONEME_DATA)
+    assert not samples.flags.writeable
+
+
 def test_pcm_rate_extension_uses_shared_periodicity_owner(monkeypatch):
     """Rate extension and pitch shifting must share one periodicity decision."""
     from qns.synth.ssi263_pcm import SSI263PCMSynth
@@ -316,8 +326,6 @@ def test_audio_player_produces_sound():
 
     Run with: uv run pytest tests/test_synth.py -m manual -v -s
     """
-    import time
-
     from qns.synth.player import AudioPlayer
 
     player = AudioPlayer(sample_rate=22050)
@@ -325,12 +333,14 @@ def test_audio_player_produces_sound():
 
     # 440 Hz sine wave for 0.5 seconds
     duration = 0.5
-    t = np.linspace(0, duration, int(22050 * duration), dtype=np.float32)
-    samples = (np.sin(2 * np.pi * 440 * t) * 0.3).astype(np.float32)
+    phase = np.arange(int(22050 * duration), dtype=np.float32)
+    phase *= np.float32(2 * np.pi * 440 / 22050)
+    samples = np.sin(phase, out=phase)
+    samples *= np.float32(0.3)
 
     print(f"\nPlaying 440 Hz sine wave for {duration}s...")
     player.play(samples)
-    time.sleep(duration + 0.1)  # Wait for playback
+    assert player.wait_until_drained(timeout=duration + 0.5)
 
     player.stop()
     print("Done.")
@@ -502,6 +512,26 @@ def test_synth_standalone_speak_uses_settings():
     assert synth.inflection == 2048
 
 
+def test_synth_speak_phonemes_queues_the_sequence_as_one_buffer():
+    """speak_phonemes renders the sequence and hands the player one write."""
+    from qns.ssi263 import playback_length_samples
+    from qns.synth import SSI263Synth
+
+    played: list[np.ndarray] = []
+
+    class Player:
+        def play(self, samples: np.ndarray) -> None:
+            played.append(samples)
+
+    synth = SSI263Synth(audio_enabled=False)
+    synth._player = Player()
+
+    synth.speak_phonemes([0x01, 0x06])
+
+    assert len(played) == 1
+    assert len(played[0]) == playback_length_samples(0x01, 0) + playback_length_samples(0x06, 0)
+
+
 # =============================================================================
 # Integration with the SSI-263 chip
 # =============================================================================
@@ -538,8 +568,6 @@ def test_synth_speaks_phoneme():
 
     Run with: uv run pytest tests/test_synth.py::test_synth_speaks_phoneme -m manual -v -s
     """
-    import time
-
     from qns.synth import SSI263Synth
 
     synth = SSI263Synth()
@@ -547,15 +575,15 @@ def test_synth_speaks_phoneme():
 
     print("\nPlaying phoneme 0x01 (E as in 'beet')...")
     synth.speak_phoneme(0x01)
-    time.sleep(0.5)
+    synth.wait_until_done()
 
     print("Playing phoneme 0x06 (EH as in 'get')...")
     synth.speak_phoneme(0x06)
-    time.sleep(0.5)
+    synth.wait_until_done()
 
     print("Playing phoneme 0x20 (L as in 'let')...")
     synth.speak_phoneme(0x20)
-    time.sleep(0.5)
+    synth.wait_until_done()
 
     synth.stop()
     print("Done.")
@@ -567,8 +595,6 @@ def test_synth_with_emulator():
 
     Run with: uv run pytest tests/test_synth.py::test_synth_with_emulator -m manual -v -s
     """
-    import time
-
     from qns.ssi263 import SSI263
     from qns.synth import SSI263Synth
 
@@ -590,11 +616,11 @@ def test_synth_with_emulator():
     print("Playing phoneme via chip...")
     chip.write(0xC3, 0x7F)  # CTL=0, amp=15
 
-    time.sleep(0.5)
+    synth.wait_until_done()
 
     # Another phoneme
     chip.write(0xC0, 0xC6)  # phoneme 6 (EH)
-    time.sleep(0.5)
+    synth.wait_until_done()
 
     synth.stop()
     print("Done.")
@@ -19,6 +19,10 @@ DEFAULT_HEADERS = (
     Path(r"C:\Users\Q\src\AppleWin\source\SSI263Phonemes.h"),
 )
 OUTPUT_FILE = Path(__file__).parent.parent / "qns" / "synth" / "phonemes.npz"
+INFO_TABLE = re.compile(r"g_nPhonemeInfo\[62\]\s*=\s*\{([^;]+)\};", re.DOTALL)
+INFO_PAIR = re.compile(r"\{(0x[0-9A-Fa-f]+),(0x[0-9A-Fa-f]+)\}")
+DATA_TABLE = re.compile(r"g_nPhonemeData\[156566\]\s*=\s*\{([^;]+)\};", re.DOTALL)
+DATA_WORD = re.compile(r"0x([0-9A-Fa-f]{1,4})\b")
 
 
 def find_header() -> Path:
@@ -36,14 +40,11 @@ def find_header() -> Path:
 
 def extract_phoneme_info(text: str) -> list[tuple[int, int]]:
     """Parse g_nPhonemeInfo into (offset_samples, length_samples) pairs."""
-    match = re.search(r"g_nPhonemeInfo\[62\]\s*=\s*\{([^;]+)\};", text, re.DOTALL)
+    match = INFO_TABLE.search(text)
     if not match:
         raise ValueError("Could not find g_nPhonemeInfo")
 
-    pairs = re.findall(
-        r"\{(0x[0-9A-Fa-f]+),(0x[0-9A-Fa-f]+)\}",
-        match.group(1),
-    )
+    pairs = INFO_PAIR.findall(match.group(1))
     info = [(int(offset, 16), int(length, 16)) for offset, length in pairs]
 
     if len(info) != 62:
@@ -58,17 +59,17 @@ def extract_phoneme_info(text: str) -> list[tuple[int, int]]:
     return info
 
 
-def extract_phoneme_data(text: str) -> list[int]:
+def extract_phoneme_data(text: str) -> np.ndarray:
     """Parse g_nPhonemeData into signed 16-bit samples."""
-    match = re.search(r"g_nPhonemeData\[156566\]\s*=\s*\{([^;]+)\};", text, re.DOTALL)
+    match = DATA_TABLE.search(text)
     if not match:
         raise ValueError("Could not find g_nPhonemeData")
 
-    values = re.findall(r"0x([0-9A-Fa-f]+)", match.group(1))
-    samples = []
-    for value in values:
-        unsigned = int(value, 16)
-        samples.append(unsigned if unsigned < 32768 else unsigned - 65536)
+    values = DATA_WORD.findall(match.group(1))
+    # Pad every literal to one big-endian word and reinterpret the whole
+    # run as two's complement in one step instead of converting each value.
+    raw = bytes.fromhex("".join(value.zfill(4) for value in values))
+    samples = np.frombuffer(raw, dtype=">i2").astype("<i2")
 
     if len(samples) != 156_566:
         raise ValueError(f"expected 156566 samples, found {len(samples)}")
@@ -78,7 +79,7 @@ def extract_phoneme_data(text: str) -> list[int]:
 def write_archive(
     output: Path,
     info: list[tuple[int, int]],
-    data: list[int],
+    data: np.ndarray,
 ) -> None:
     """Write the compact, typed phoneme archive."""
     output.parent.mkdir(parents=True, exist_ok=True)